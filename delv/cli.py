@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 import click
-import pyperclip
 
 from . import display
 from .config import (
@@ -14,7 +14,6 @@ from .config import (
     get_current_tree_name,
     set_current_tree_name,
 )
-from .editor import edit_node_interactive
 from .storage import (
     copy_tree,
     delete_tree,
@@ -22,6 +21,9 @@ from .storage import (
     export_tree_markdown,
     import_tree,
     list_trees,
+    load_current_id,
+    load_node,
+    load_path,
     load_tree,
     rename_tree,
     save_tree,
@@ -30,17 +32,22 @@ from .storage import (
 from .tree import ExplorationTree, NodeStatus
 
 
-def get_current_tree() -> ExplorationTree:
-    """Get the current tree or raise an error."""
+def _load_current(loader, *args):
+    """Call a storage loader on the current tree or raise an error."""
     name = get_current_tree_name()
     if not name:
         raise click.ClickException("No tree is currently open. Use 'delv open <name>' or 'delv new <name>'")
     try:
-        return load_tree(name)
+        return loader(name, *args)
     except FileNotFoundError:
         raise click.ClickException(f"Tree '{name}' not found")
 
 
+def get_current_tree() -> ExplorationTree:
+    """Get the current tree or raise an error."""
+    return _load_current(load_tree)
+
+
 def save_current(tree: ExplorationTree) -> None:
     """Save the current tree."""
     save_tree(tree)
@@ -57,11 +64,11 @@ def cli(ctx):
     ensure_delv_dir()
     
     if ctx.invoked_subcommand is None:
-        config = Config.load()
-        if config.default_mode == "tui":
-            ctx.invoke(tui_cmd)
+        if Config.load().default_mode == "tui":
+            from .tui import run_tui
+            run_tui()
         else:
-            ctx.invoke(show_cmd)
+            display.print_tree(get_current_tree())
 
 
 # === Mode commands ===
@@ -168,16 +175,15 @@ def cp_tree_cmd(src, dst):
 @cli.command("path")
 def path_cmd():
     """Show path from root to current node."""
-    tree = get_current_tree()
-    display.print_path(tree)
+    display.print_path(_load_current(load_path))
 
 
 @cli.command("cat")
 @click.argument("node_id", required=False)
 def cat_cmd(node_id):
     """Output node body."""
-    tree = get_current_tree()
-    display.print_node_body(tree, node_id)
+    nid = node_id or _load_current(load_current_id)
+    display.print_node_body(_load_current(load_node, nid), nid)
 
 
 # === Navigation ===
@@ -195,8 +201,7 @@ def go_cmd(node_id):
     display.print_success(f"Moved to [{node_id}]")
 
 
-@cli.command("up")
-def up_cmd():
+def _up_impl() -> None:
     """Go to parent node."""
     tree = get_current_tree()
     if tree.go_up():
@@ -206,9 +211,13 @@ def up_cmd():
         display.print_info("Already at root")
 
 
-@cli.command("down")
-@click.argument("n", type=int, default=0)
-def down_cmd(n):
+@cli.command("up")
+def up_cmd():
+    """Go to parent node."""
+    _up_impl()
+
+
+def _down_impl(n: int = 0) -> None:
     """Go to nth child node."""
     tree = get_current_tree()
     if tree.go_down(n):
@@ -218,8 +227,14 @@ def down_cmd(n):
         display.print_info("No children")
 
 
-@cli.command("next")
-def next_cmd():
+@cli.command("down")
+@click.argument("n", type=int, default=0)
+def down_cmd(n):
+    """Go to nth child node."""
+    _down_impl(n)
+
+
+def _next_impl() -> None:
     """Go to next sibling."""
     tree = get_current_tree()
     if tree.go_next_sibling():
@@ -229,8 +244,13 @@ def next_cmd():
         display.print_info("No next sibling")
 
 
-@cli.command("prev")
-def prev_cmd():
+@cli.command("next")
+def next_cmd():
+    """Go to next sibling."""
+    _next_impl()
+
+
+def _prev_impl() -> None:
     """Go to previous sibling."""
     tree = get_current_tree()
     if tree.go_prev_sibling():
@@ -240,8 +260,13 @@ def prev_cmd():
         display.print_info("No previous sibling")
 
 
-@cli.command("root")
-def root_cmd():
+@cli.command("prev")
+def prev_cmd():
+    """Go to previous sibling."""
+    _prev_impl()
+
+
+def _root_impl() -> None:
     """Go to root node."""
     tree = get_current_tree()
     tree.go_root()
@@ -249,8 +274,13 @@ def root_cmd():
     display.print_success("Moved to root")
 
 
-@cli.command("back")
-def back_cmd():
+@cli.command("root")
+def root_cmd():
+    """Go to root node."""
+    _root_impl()
+
+
+def _back_impl() -> None:
     """Go back in history."""
     tree = get_current_tree()
     if tree.go_back():
@@ -260,6 +290,12 @@ def back_cmd():
         display.print_info("No history")
 
 
+@cli.command("back")
+def back_cmd():
+    """Go back in history."""
+    _back_impl()
+
+
 # === Editing ===
 
 @cli.command("add")
@@ -285,12 +321,16 @@ def add_cmd(title, sibling):
 @click.argument("node_id", required=False)
 def edit_cmd(node_id):
     """Edit a node in external editor."""
+    from .editor import edit_node_interactive
+    
     tree = get_current_tree()
     nid = node_id or tree.current
     try:
-        edit_node_interactive(tree, nid)
-        save_current(tree)
-        display.print_success(f"Updated node [{nid}]")
+        if edit_node_interactive(tree, nid):
+            save_current(tree)
+            display.print_success(f"Updated node [{nid}]")
+        else:
+            display.print_info(f"No changes to [{nid}]")
     except ValueError as e:
         raise click.ClickException(str(e))
 
@@ -319,6 +359,8 @@ def append_cmd(text):
 @click.argument("node_id", required=False)
 def yank_cmd(node_id):
     """Copy node body to clipboard."""
+    import pyperclip
+    
     tree = get_current_tree()
     nid = node_id or tree.current
     node = tree.nodes.get(nid)
@@ -332,6 +374,8 @@ def yank_cmd(node_id):
 @cli.command("paste")
 def paste_cmd():
     """Paste clipboard to current node's body."""
+    import pyperclip
+    
     tree = get_current_tree()
     text = pyperclip.paste()
     tree.append_body(tree.current, text)
@@ -341,9 +385,7 @@ def paste_cmd():
 
 # === Status ===
 
-@cli.command("done")
-@click.argument("summary", required=False)
-def done_cmd(summary):
+def _done_impl(summary: str | None = None) -> None:
     """Mark current node as done."""
     tree = get_current_tree()
     if summary:
@@ -353,9 +395,14 @@ def done_cmd(summary):
     display.print_success(f"Marked as done, moved to [{tree.current}]")
 
 
-@cli.command("drop")
-@click.argument("reason", required=False)
-def drop_cmd(reason):
+@cli.command("done")
+@click.argument("summary", required=False)
+def done_cmd(summary):
+    """Mark current node as done."""
+    _done_impl(summary)
+
+
+def _drop_impl(reason: str | None = None) -> None:
     """Mark current node as dropped."""
     tree = get_current_tree()
     if reason:
@@ -365,22 +412,39 @@ def drop_cmd(reason):
     display.print_success(f"Marked as dropped, moved to [{tree.current}]")
 
 
+@cli.command("drop")
+@click.argument("reason", required=False)
+def drop_cmd(reason):
+    """Mark current node as dropped."""
+    _drop_impl(reason)
+
+
+def _todo_impl() -> None:
+    """Mark current node as todo."""
+    tree = get_current_tree()
+    if tree.set_status(tree.current, NodeStatus.TODO, auto_up=False):
+        save_current(tree)
+    display.print_success("Marked as todo")
+
+
 @cli.command("todo")
 def todo_cmd():
     """Mark current node as todo."""
+    _todo_impl()
+
+
+def _active_impl() -> None:
+    """Mark current node as active."""
     tree = get_current_tree()
-    tree.set_status(tree.current, NodeStatus.TODO, auto_up=False)
-    save_current(tree)
-    display.print_success("Marked as todo")
+    if tree.set_status(tree.current, NodeStatus.ACTIVE, auto_up=False):
+        save_current(tree)
+    display.print_success("Marked as active")
 
 
 @cli.command("active")
 def active_cmd():
     """Mark current node as active."""
-    tree = get_current_tree()
-    tree.set_status(tree.current, NodeStatus.ACTIVE, auto_up=False)
-    save_current(tree)
-    display.print_success("Marked as active")
+    _active_impl()
 
 
 # === Links ===
@@ -582,6 +646,51 @@ def log_cmd():
     display.print_history(tree)
 
 
+# === Fast path ===
+
+# Bare navigation/status commands that can run without Click parsing argv
+# and building a Context. Each maps to the same helper its Click command uses.
+_FAST = {
+    "up": _up_impl,
+    "down": _down_impl,
+    "next": _next_impl,
+    "prev": _prev_impl,
+    "root": _root_impl,
+    "back": _back_impl,
+    "done": _done_impl,
+    "drop": _drop_impl,
+    "todo": _todo_impl,
+    "active": _active_impl,
+}
+
+
+def run_fast_path(argv: list[str]) -> bool:
+    """
+    Run a bare hot-path command (e.g. `delv up`) without Click.
+    
+    Returns True if argv was handled, False if it should go through cli().
+    """
+    if len(argv) != 1 or argv[0] not in _FAST:
+        return False
+    
+    ensure_delv_dir()
+    # The error handling Click's standalone mode would otherwise provide
+    try:
+        _FAST[argv[0]]()
+    except click.ClickException as e:
+        e.show()
+        sys.exit(e.exit_code)
+    except (EOFError, KeyboardInterrupt):
+        click.echo(file=sys.stderr)
+        click.echo("Aborted!", file=sys.stderr)
+        sys.exit(1)
+    except click.Abort:
+        click.echo("Aborted!", file=sys.stderr)
+        sys.exit(1)
+    return True
+
+
 if __name__ == "__main__":
-    cli()
+    if not run_fast_path(sys.argv[1:]):
+        cli()
 
@@ -6,7 +6,33 @@ import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import Iterable, Literal
+
+
+# fdatasync skips the metadata-only flush; not available on macOS or Windows
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def atomic_write_bytes(path: Path, data: bytes | Iterable[bytes], sync: bool = False) -> None:
+    """
+    Write data to path atomically.
+    
+    The data goes to a sibling temp file which then replaces path, so a
+    crash mid-write never leaves a truncated file behind. With sync, the
+    temp file is also flushed to disk before the rename, so a power loss
+    can't leave path pointing at an empty file either; that costs a disk
+    flush, so only explicit saves ask for it.
+    """
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(temp_path, "wb") as f:
+        if isinstance(data, bytes):
+            f.write(data)
+        else:
+            f.writelines(data)
+        if sync:
+            f.flush()
+            _fdatasync(f.fileno())
+    os.replace(temp_path, path)
 
 
 def get_delv_dir() -> Path:
@@ -28,34 +54,40 @@ class Config:
     def load(cls) -> "Config":
         """Load configuration from file."""
         config_path = get_delv_dir() / "config.json"
-        if config_path.exists():
-            try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                return cls(
-                    editor=data.get("editor", "vim"),
-                    default_mode=data.get("defaultMode", "tui"),
-                    theme=data.get("theme", "delv-tokyo-night"),
-                )
-            except (json.JSONDecodeError, IOError):
-                pass
-        return cls()
+        # Open directly rather than probing with exists(); a missing file
+        # is an IOError like any other read failure
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return cls()
+        return cls(
+            editor=data.get("editor", "vim"),
+            default_mode=data.get("defaultMode", "tui"),
+            theme=data.get("theme", "delv-tokyo-night"),
+        )
     
     def save(self) -> None:
         """Save configuration to file."""
         config_path = get_delv_dir() / "config.json"
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump({
-                "editor": self.editor,
-                "defaultMode": self.default_mode,
-                "theme": self.theme,
-            }, f, indent=2)
+        data = json.dumps({
+            "editor": self.editor,
+            "defaultMode": self.default_mode,
+            "theme": self.theme,
+        }, indent=2)
+        atomic_write_bytes(config_path, data.encode("utf-8"))
 
 
 def ensure_delv_dir() -> Path:
     """Ensure the Delv directory structure exists."""
     delv_dir = get_delv_dir()
+    try:
+        # The trees dir only exists once the whole layout has been created
+        os.stat(delv_dir / "trees")
+        return delv_dir
+    except FileNotFoundError:
+        pass
     delv_dir.mkdir(parents=True, exist_ok=True)
     (delv_dir / "trees").mkdir(exist_ok=True)
     return delv_dir
@@ -64,19 +96,20 @@ def ensure_delv_dir() -> Path:
 def get_current_tree_name() -> str | None:
     """Get the name of the currently open tree."""
     current_file = get_delv_dir() / "current"
-    if current_file.exists():
+    try:
         return current_file.read_text(encoding="utf-8").strip() or None
-    return None
+    except FileNotFoundError:
+        return None
 
 
 def set_current_tree_name(name: str | None) -> None:
     """Set the name of the currently open tree."""
-    ensure_delv_dir()
+    # The data dir is ensured once per run by the CLI entry point
     current_file = get_delv_dir() / "current"
     if name:
-        current_file.write_text(name, encoding="utf-8")
-    elif current_file.exists():
-        current_file.unlink()
+        atomic_write_bytes(current_file, name.encode("utf-8"))
+    else:
+        current_file.unlink(missing_ok=True)
 
 
 def get_editor() -> str:
@@ -2,16 +2,43 @@
 
 from __future__ import annotations
 
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.text import Text
-from rich.tree import Tree as RichTree
+from typing import TYPE_CHECKING
+
+import click
 
 from .tree import ExplorationTree, Node, NodeStatus
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+
+# rich is imported on first use so that commands which only print a
+# status line (up, down, go, done, ...) never load it.
+_console_instance: Console | None = None
+
+
+def _console() -> Console:
+    """Get the shared rich console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+        _console_instance = Console()
+    return _console_instance
 
-console = Console()
+
+_STATUS_COLORS = {
+    NodeStatus.ACTIVE: "green",
+    NodeStatus.DONE: "blue",
+    NodeStatus.DROPPED: "red",
+    NodeStatus.TODO: "yellow",
+}
+
+# (icon text, style) per status, so labels don't format the icon per node
+_STATUS_LABELS = {status: (f"{status.icon} ", color) for status, color in _STATUS_COLORS.items()}
+
+_HERE = " ← HERE"
+_HERE_STYLE = "bold magenta"
 
 
 def format_status_counts(tree: ExplorationTree) -> str:
@@ -31,26 +58,22 @@ def format_status_counts(tree: ExplorationTree) -> str:
 
 def format_node_label(node: Node, current_id: str, show_id: bool = True) -> Text:
     """Format a node label with status icon and optional current marker."""
+    from rich.text import Text
+    
     text = Text()
     
     if show_id and node.id != "root":
         text.append(f"[{node.id}] ", style="dim")
     
     # Status icon with color
-    status_colors = {
-        NodeStatus.ACTIVE: "green",
-        NodeStatus.DONE: "blue",
-        NodeStatus.DROPPED: "red",
-        NodeStatus.TODO: "yellow",
-    }
-    text.append(f"{node.status.icon} ", style=status_colors[node.status])
+    text.append(*_STATUS_LABELS[node.status])
     
     # Title
     text.append(node.title)
     
     # Current marker
     if node.id == current_id:
-        text.append(" ← HERE", style="bold magenta")
+        text.append(_HERE, style=_HERE_STYLE)
     
     return text
 
@@ -58,6 +81,12 @@ def format_node_label(node: Node, current_id: str, show_id: bool = True) -> Text
 def print_tree(tree: ExplorationTree, max_depth: int | None = None, 
                show_all: bool = False) -> None:
     """Print the tree structure."""
+    from rich.markdown import Markdown
+    from rich.text import Text
+    from rich.tree import Tree as RichTree
+    
+    console = _console()
+    
     # Header
     console.print()
     header = Text(tree.name, style="bold cyan")
@@ -67,27 +96,36 @@ def print_tree(tree: ExplorationTree, max_depth: int | None = None,
     console.rule(style="dim")
     console.print()
     
-    # Build tree display
-    def add_children(rich_node, node_id: str, depth: int):
-        node = tree.nodes[node_id]
-        
-        for child_id in node.children:
-            child = tree.nodes[child_id]
-            label = format_node_label(child, tree.current)
-            child_rich = rich_node.add(label)
-            
-            if max_depth is None or depth < max_depth:
-                add_children(child_rich, child_id, depth + 1)
+    nodes = tree.nodes
+    current_id = tree.current
     
-    root = tree.nodes["root"]
+    root = nodes["root"]
     root_label = Text()
     root_label.append("root: ", style="dim")
     root_label.append(root.title, style="bold")
     if root.id == tree.current:
-        root_label.append(" ← HERE", style="bold magenta")
+        root_label.append(_HERE, style=_HERE_STYLE)
     
+    # Build tree display iteratively: (rich parent, node id, depth of its children)
     rich_tree = RichTree(root_label)
-    add_children(rich_tree, "root", 1)
+    stack = [(rich_tree, "root", 1)]
+    while stack:
+        rich_parent, node_id, depth = stack.pop()
+        descend = max_depth is None or depth < max_depth
+        
+        for child_id in nodes[node_id].children:
+            child = nodes[child_id]
+            # Inlined format_node_label: children are never root
+            label = Text()
+            label.append(f"[{child_id}] ", style="dim")
+            label.append(*_STATUS_LABELS[child.status])
+            label.append(child.title)
+            if child_id == current_id:
+                label.append(_HERE, style=_HERE_STYLE)
+            child_rich = rich_parent.add(label)
+            
+            if descend:
+                stack.append((child_rich, child_id, depth + 1))
     
     console.print(rich_tree)
     console.print()
@@ -162,27 +200,24 @@ def print_tree(tree: ExplorationTree, max_depth: int | None = None,
     console.print()
 
 
-def print_path(tree: ExplorationTree) -> None:
+def print_path(path: list[Node]) -> None:
     """Print the path from root to current node."""
-    path = tree.get_path_to_root(tree.current)
-    
+    console = _console()
     parts = []
-    for node_id in path:
-        node = tree.nodes[node_id]
-        if node_id == "root":
+    for node in path:
+        if node.id == "root":
             parts.append(f"root:{node.title}")
         else:
-            parts.append(f"{node_id}:{node.title}")
+            parts.append(f"{node.id}:{node.title}")
     
     console.print(" → ".join(parts))
 
 
-def print_node_body(tree: ExplorationTree, node_id: str | None = None) -> None:
+def print_node_body(node: Node | None, node_id: str) -> None:
     """Print just the body of a node."""
-    nid = node_id or tree.current
-    node = tree.nodes.get(nid)
+    console = _console()
     if not node:
-        console.print(f"[red]Node {nid} not found[/red]")
+        console.print(f"[red]Node {node_id} not found[/red]")
         return
     
     if node.body:
@@ -194,6 +229,7 @@ def print_node_body(tree: ExplorationTree, node_id: str | None = None) -> None:
 def print_node_list(tree: ExplorationTree, node_ids: list[str], 
                     title: str | None = None) -> None:
     """Print a list of nodes."""
+    console = _console()
     if title:
         console.print(f"\n[bold]{title}[/bold]")
         console.rule(style="dim")
@@ -211,6 +247,7 @@ def print_node_list(tree: ExplorationTree, node_ids: list[str],
 
 def print_links(tree: ExplorationTree, node_id: str | None = None) -> None:
     """Print links for a node."""
+    console = _console()
     nid = node_id or tree.current
     node = tree.nodes.get(nid)
     if not node:
@@ -229,6 +266,7 @@ def print_backlinks(tree: ExplorationTree, node_id: str | None = None) -> None:
 
 def print_statistics(tree: ExplorationTree) -> None:
     """Print tree statistics."""
+    console = _console()
     stats = tree.get_statistics()
     
     console.print(f"\n[bold]{tree.name}[/bold] Statistics")
@@ -245,6 +283,7 @@ def print_statistics(tree: ExplorationTree) -> None:
 
 def print_history(tree: ExplorationTree) -> None:
     """Print navigation history."""
+    console = _console()
     console.print("\n[bold]Navigation History[/bold]")
     console.rule(style="dim")
     
@@ -258,6 +297,7 @@ def print_history(tree: ExplorationTree) -> None:
 
 def print_trees_list(trees: list[str], current: str | None = None) -> None:
     """Print list of available trees."""
+    console = _console()
     console.print("\n[bold]Available Trees[/bold]")
     console.rule(style="dim")
     
@@ -275,15 +315,15 @@ def print_trees_list(trees: list[str], current: str | None = None) -> None:
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[red]Error:[/red] {message}")
+    click.echo(f"{click.style('Error:', fg='red')} {message}")
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[green]✓[/green] {message}")
+    click.echo(f"{click.style('✓', fg='green')} {message}")
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    console.print(f"[blue]ℹ[/blue] {message}")
+    click.echo(f"{click.style('ℹ', fg='blue')} {message}")
 
@@ -7,8 +7,6 @@ import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
-
 from .config import get_editor
 from .tree import ExplorationTree, Node, NodeStatus
 
@@ -23,16 +21,62 @@ class NodeEdit:
 
 
 def format_node_for_edit(node: Node) -> str:
-    """Format a node for external editing with YAML frontmatter."""
+    """Format a node for external editing with YAML-style frontmatter."""
     return f"""---
 title: {node.title}
 status: {node.status.value}
-links: {node.links}
+links: [{", ".join(node.links)}]
 ---
 
 {node.body}"""
 
 
+def _unquote(value: str) -> str:
+    """Strip one pair of matching surrounding quotes."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        return value[1:-1]
+    return value
+
+
+def _parse_list(value: str) -> list[str]:
+    """Parse a flow list (`[a, 'b']`) or a comma-separated string."""
+    if value.startswith("[") and value.endswith("]"):
+        value = value[1:-1]
+    items = (_unquote(item.strip()) for item in value.split(","))
+    return [item for item in items if item]
+
+
+def _parse_frontmatter(lines: list[str]) -> dict:
+    """
+    Parse the flat frontmatter lines written by format_node_for_edit.
+    
+    Only the subset we emit is supported: `key: value` scalars, flow lists
+    and block lists (`- item` lines under an empty key).
+    Raises ValueError on anything else.
+    """
+    fm: dict = {}
+    list_key: str | None = None
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("- ") and list_key is not None:
+            fm[list_key].append(_unquote(line[2:].strip()))
+            continue
+        key, sep, value = line.partition(":")
+        if not sep:
+            raise ValueError(f"Malformed frontmatter line: {raw_line!r}")
+        key = key.strip()
+        value = value.strip()
+        if key == "links":
+            fm[key] = _parse_list(value)
+            list_key = key if not value else None
+        else:
+            fm[key] = _unquote(value)
+            list_key = None
+    return fm
+
+
 def parse_node_frontmatter(
     content: str,
     default_title: str,
@@ -40,17 +84,21 @@ def parse_node_frontmatter(
     default_links: list[str],
 ) -> NodeEdit:
     """Parse frontmatter from node edit content."""
-    if not content.startswith("---"):
+    # Split on "\n" only: splitlines() would also break the body at form
+    # feeds, \x1c-\x1e, \x85 and the Unicode line/paragraph separators
+    lines = [line.removesuffix("\r") for line in content.split("\n")]
+    if lines[0].rstrip() != "---":
         return NodeEdit(default_title, default_status, default_links, content.strip())
     
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    # The header ends at the first `---` line; dashes inside a title or body don't count
+    end = next((i for i in range(1, len(lines)) if lines[i].rstrip() == "---"), None)
+    if end is None:
         return NodeEdit(default_title, default_status, default_links, content.strip())
     
     try:
-        fm = yaml.safe_load(parts[1]) or {}
-    except yaml.YAMLError:
-        # If YAML parsing fails, treat as body-only
+        fm = _parse_frontmatter(lines[1:end])
+    except ValueError:
+        # If frontmatter parsing fails, treat as body-only
         return NodeEdit(default_title, default_status, default_links, content.strip())
     
     # Parse status
@@ -63,17 +111,12 @@ def parse_node_frontmatter(
     
     # Parse links
     links = fm.get("links", default_links)
-    if links is None:
-        links = []
-    elif isinstance(links, str):
-        # Handle comma-separated string format
-        links = [l.strip() for l in links.split(",") if l.strip()]
     
     return NodeEdit(
         title=fm.get("title", default_title),
         status=status,
         links=links,
-        body=parts[2].strip(),
+        body="\n".join(lines[end + 1:]).strip(),
     )
 
 
@@ -101,6 +144,9 @@ def edit_node_interactive(tree: ExplorationTree, node_id: str) -> bool:
         subprocess.run([editor, str(temp_path)], check=True)
         
         new_content = temp_path.read_text(encoding="utf-8")
+        if new_content == content:
+            return False  # Editor closed without saving changes
+        
         edit = parse_node_frontmatter(
             new_content, node.title, node.status, node.links
         )
@@ -1,11 +1,14 @@
 """Main entry point for Delv."""
 
-from .cli import cli
+import sys
+
+from .cli import cli, run_fast_path
 
 
 def main():
     """Main entry point."""
-    cli()
+    if not run_fast_path(sys.argv[1:]):
+        cli()
 
 
 if __name__ == "__main__":
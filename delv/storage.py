@@ -3,11 +3,37 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterable, Iterator
 
-from .config import ensure_delv_dir, get_delv_dir
-from .tree import ExplorationTree
+from .config import atomic_write_bytes, ensure_delv_dir, get_delv_dir
+from .tree import ExplorationTree, Node
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the `fast` extra
+    orjson = None
+
+# Tail of the first line of a tree file, where the node lines begin
+_NODES_OPEN = b', "nodes": {'
+
+
+def _loads(data: bytes):
+    """Parse UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 
 def get_trees_dir() -> Path:
@@ -33,34 +59,204 @@ def get_tree_path(name: str) -> Path:
     return get_trees_dir() / f"{name}.json"
 
 
+def _read_tree_bytes(name: str) -> bytes:
+    """Read the raw contents of a tree file."""
+    try:
+        return get_tree_path(name).read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Tree '{name}' not found") from None
+
+
+@contextmanager
+def _map_tree_file(name: str, advice: int | None = None) -> Iterator[mmap.mmap | bytes]:
+    """
+    Map a tree file read-only for the duration of the block.
+    
+    The pages come from the shared page cache on demand instead of being
+    copied into a private buffer, so reading a few node lines of a large
+    file only touches those pages.
+    """
+    try:
+        f = get_tree_path(name).open("rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Tree '{name}' not found") from None
+    
+    with f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            yield b""
+            return
+    with mm:
+        if advice is not None and hasattr(mm, "madvise"):
+            mm.madvise(advice)
+        yield mm
+
+
 def load_tree(name: str) -> ExplorationTree:
     """Load a tree from disk."""
-    path = get_tree_path(name)
-    if not path.exists():
-        raise FileNotFoundError(f"Tree '{name}' not found")
-    
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is None:
+        # The stdlib parser needs a bytes object; one read, no text wrapper
+        return ExplorationTree.from_dict(_loads(_read_tree_bytes(name)))
     
+    # orjson parses straight from the mapped pages, without a copy of the file
+    with _map_tree_file(name, getattr(mmap, "MADV_SEQUENTIAL", None)) as raw:
+        with memoryview(raw) as view:
+            data = orjson.loads(view)
     return ExplorationTree.from_dict(data)
 
 
-def save_tree(tree: ExplorationTree, backup: bool = True) -> None:
+def _parse_header(raw: bytes | mmap.mmap) -> dict | None:
+    """Parse the metadata line of a tree file, or None for older pretty-printed files."""
+    first = raw[:raw.find(b"\n")]
+    if not first.endswith(_NODES_OPEN):
+        return None
+    try:
+        return _loads(first[:-len(_NODES_OPEN)] + b"}")
+    except ValueError:  # Hand-edited so that the line only looks like a header
+        return None
+
+
+def _find_node(raw: bytes | mmap.mmap, node_id: str) -> Node | None:
+    """
+    Decode a single node from a tree file by locating its line.
+    
+    Returns None if there is no such line or it doesn't hold a whole node,
+    as in a hand-edited file that is still valid JSON; callers then decode
+    the full file instead.
+    """
+    # Newlines inside JSON strings are escaped, so a raw newline always starts a node line
+    key = b"\n" + _dumps(node_id) + b": "
+    start = raw.find(key)
+    if start < 0:
+        return None
+    start += len(key)
+    end = raw.find(b"\n", start)
+    try:
+        return Node.from_dict(_loads(raw[start:end].rstrip(b",")))
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _find_path(raw: bytes | mmap.mmap, node_id: str) -> list[Node] | None:
+    """Decode the nodes from root down to node_id by their lines, or None if one isn't found."""
+    path = []
+    nid: str | None = node_id
+    while nid:
+        node = _find_node(raw, nid)
+        if node is None:
+            return None
+        path.append(node)
+        nid = node.parent
+    path.reverse()
+    return path
+
+
+def load_path(name: str, node_id: str | None = None) -> list[Node]:
+    """Load only the nodes from root down to node_id (default: the current node)."""
+    with _map_tree_file(name) as raw:
+        header = _parse_header(raw)
+        if header is not None:
+            path = _find_path(raw, node_id or header.get("current", "root"))
+            if path is not None:
+                return path
+        
+        # Older pretty-printed or hand-edited file, or a missing node: decode it all
+        tree = ExplorationTree.from_dict(_loads(raw[:]))
+    nid = node_id or tree.current
+    if nid not in tree.nodes:
+        return []
+    return [tree.nodes[n] for n in tree.get_path_to_root(nid)]
+
+
+def load_current_id(name: str) -> str:
+    """Read a tree's current node ID from its metadata line."""
+    with _map_tree_file(name) as raw:
+        header = _parse_header(raw)
+        if header is None:
+            # Older pretty-printed or hand-edited file: decode it all
+            return ExplorationTree.from_dict(_loads(raw[:])).current
+    return header.get("current", "root")
+
+
+def load_node(name: str, node_id: str | None = None) -> Node | None:
+    """Load a single node (default: the current node) without decoding the rest."""
+    with _map_tree_file(name) as raw:
+        header = _parse_header(raw)
+        if header is not None:
+            node = _find_node(raw, node_id or header.get("current", "root"))
+            if node is not None:
+                return node
+        
+        # Older pretty-printed or hand-edited file, or a missing node: decode it all
+        tree = ExplorationTree.from_dict(_loads(raw[:]))
+    return tree.nodes.get(node_id or tree.current)
+
+
+def _iter_tree_json(tree: ExplorationTree) -> Iterator[bytes]:
+    """
+    Yield the tree as UTF-8 encoded JSON, one piece per node.
+    
+    Layout: the metadata on the first line, then one `"id": {...}` node per
+    line. The result is plain JSON, but it is produced without building the
+    full tree dict or the whole document string in memory.
+    """
+    # orjson formats datetimes in C, identically to isoformat()
+    header = tree.header_to_dict(raw_datetimes=orjson is not None)
+    yield _dumps(header)[:-1] + _NODES_OPEN + b"\n"
+    
+    sep = b""
+    for node_id, node in tree.nodes.items():
+        yield sep + _dumps(node_id) + b": " + _dumps(node.to_dict())
+        sep = b",\n"
+    
+    yield b"\n}}\n"
+
+
+def _renamed_tree_bytes(raw: bytes, new_name: str) -> bytes:
+    """Return tree file contents with the tree name replaced."""
+    header = _parse_header(raw)
+    if header is None:
+        # Older pretty-printed file: decode it and write the current layout
+        tree = ExplorationTree.from_dict(_loads(raw))
+        tree.name = new_name
+        return b"".join(_iter_tree_json(tree))
+    
+    # Only the metadata line changes; node lines are copied as raw bytes
+    header["name"] = new_name
+    return _dumps(header)[:-1] + _NODES_OPEN + raw[raw.find(b"\n"):]
+
+
+def save_tree(tree: ExplorationTree, backup: bool = True, sync: bool = False) -> None:
     """Save a tree to disk."""
+    # Stream node by node into a temp file, then swap it in atomically
+    write_tree_data(tree.name, _iter_tree_json(tree), backup, sync)
+
+
+def encode_tree(tree: ExplorationTree) -> bytes:
+    """Serialize a tree to the bytes save_tree would write."""
+    return b"".join(_iter_tree_json(tree))
+
+
+def write_tree_data(
+    name: str, data: bytes | Iterable[bytes], backup: bool = True, sync: bool = False
+) -> None:
+    """Write already serialized tree data as the file for tree name."""
     ensure_delv_dir()
-    path = get_tree_path(tree.name)
+    path = get_tree_path(name)
     
-    # Create backup if file exists
+    # Create backup if file exists. The new contents go to a fresh inode via
+    # rename, so a hard link keeps the old file as the backup with no copying.
     if backup and path.exists():
         backup_path = path.with_suffix(".json.bak")
-        shutil.copy2(path, backup_path)
+        backup_path.unlink(missing_ok=True)
+        try:
+            os.link(path, backup_path)
+        except OSError:
+            # No hard links here (e.g. FAT, some network mounts)
+            shutil.copy2(path, backup_path)
     
-    # Write atomically via temp file
-    temp_path = path.with_suffix(".json.tmp")
-    with open(temp_path, "w", encoding="utf-8") as f:
-        json.dump(tree.to_dict(), f, indent=2, ensure_ascii=False)
-    
-    temp_path.replace(path)
+    atomic_write_bytes(path, data, sync)
 
 
 def delete_tree(name: str) -> None:
@@ -84,10 +280,10 @@ def rename_tree(old_name: str, new_name: str) -> None:
     if new_path.exists():
         raise FileExistsError(f"Tree '{new_name}' already exists")
     
-    # Load, update name, save with new name
-    tree = load_tree(old_name)
-    tree.name = new_name
-    save_tree(tree, backup=False)
+    # Write under the new name with only the name field rewritten
+    atomic_write_bytes(
+        new_path, _renamed_tree_bytes(_read_tree_bytes(old_name), new_name), sync=True
+    )
     
     # Delete old file
     old_path.unlink()
@@ -106,65 +302,92 @@ def copy_tree(src_name: str, dst_name: str) -> None:
     if dst_path.exists():
         raise FileExistsError(f"Tree '{dst_name}' already exists")
     
-    # Load, update name, save with new name
-    tree = load_tree(src_name)
-    tree.name = dst_name
-    save_tree(tree, backup=False)
+    # Write under the new name with only the name field rewritten
+    atomic_write_bytes(
+        dst_path, _renamed_tree_bytes(_read_tree_bytes(src_name), dst_name), sync=True
+    )
 
 
-def export_tree(tree: ExplorationTree, path: Path | None = None) -> str:
-    """Export tree to JSON string or file."""
-    data = json.dumps(tree.to_dict(), indent=2, ensure_ascii=False)
-    if path:
-        path.write_text(data, encoding="utf-8")
-    return data
+def export_tree(tree: ExplorationTree, path: Path | None = None) -> str | None:
+    """
+    Export tree to JSON.
+    
+    With a path the UTF-8 bytes are written directly and None is returned;
+    otherwise the JSON text is returned.
+    """
+    if orjson is None:
+        text = json.dumps(tree.to_dict(), indent=2, ensure_ascii=False)
+        if path is None:
+            return text
+        path.write_text(text, encoding="utf-8")
+        return None
+    
+    # orjson already produces UTF-8 bytes; only decode when text is wanted
+    data = orjson.dumps(tree.to_dict(), option=orjson.OPT_INDENT_2)
+    if path is None:
+        return data.decode("utf-8")
+    path.write_bytes(data)
+    return None
 
 
-def export_tree_markdown(tree: ExplorationTree, path: Path | None = None) -> str:
-    """Export tree to Markdown format."""
-    lines = [f"# {tree.name}", ""]
+def _iter_markdown(tree: ExplorationTree) -> Iterator[str]:
+    """Yield the Markdown export line by line (without newlines)."""
+    yield f"# {tree.name}"
+    yield ""
     
-    def _export_node(node_id: str, depth: int = 0):
+    # Iterative DFS; every node's lines come before its children's
+    stack = [("root", 0)]
+    while stack:
+        node_id, depth = stack.pop()
         node = tree.nodes[node_id]
         indent = "  " * depth
         prefix = "- " if depth > 0 else ""
         status_icon = node.status.icon
         
-        lines.append(f"{indent}{prefix}**[{node.id}]** {status_icon} {node.title}")
+        yield f"{indent}{prefix}**[{node.id}]** {status_icon} {node.title}"
         
         if node.body:
-            lines.append("")
+            yield ""
             for line in node.body.split("\n"):
-                lines.append(f"{indent}  {line}")
-            lines.append("")
+                yield f"{indent}  {line}"
+            yield ""
         
         if node.links:
             link_strs = [f"[{lid}]" for lid in node.links]
-            lines.append(f"{indent}  → Links: {', '.join(link_strs)}")
-            lines.append("")
+            yield f"{indent}  → Links: {', '.join(link_strs)}"
+            yield ""
         
-        for child_id in node.children:
-            _export_node(child_id, depth + 1)
+        stack.extend((child_id, depth + 1) for child_id in reversed(node.children))
+
+
+def export_tree_markdown(tree: ExplorationTree, path: Path | None = None) -> str | None:
+    """
+    Export tree to Markdown format.
     
-    _export_node("root")
+    With a path the lines are streamed straight to the file and None is
+    returned; otherwise the Markdown text is returned.
+    """
+    lines = _iter_markdown(tree)
+    if path is None:
+        return "\n".join(lines)
     
-    result = "\n".join(lines)
-    if path:
-        path.write_text(result, encoding="utf-8")
-    return result
+    with path.open("w", encoding="utf-8") as f:
+        sep = ""
+        for line in lines:
+            f.write(sep)
+            f.write(line)
+            sep = "\n"
+    return None
 
 
 def import_tree(path: Path) -> ExplorationTree:
     """Import tree from JSON file."""
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    
-    tree = ExplorationTree.from_dict(data)
+    tree = ExplorationTree.from_dict(_loads(path.read_bytes()))
     
     # Check if tree with this name exists
     if tree_exists(tree.name):
         raise FileExistsError(f"Tree '{tree.name}' already exists")
     
-    save_tree(tree, backup=False)
+    save_tree(tree, backup=False, sync=True)
     return tree
 
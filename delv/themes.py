@@ -5,14 +5,14 @@ from __future__ import annotations
 from textual.theme import Theme
 
 
-THEME_NAMES = [
+THEME_NAMES = (
     "delv-tokyo-night",
     "delv-gruvbox",
     "delv-catppuccin",
     "delv-nord",
     "delv-solarized-light",
     "delv-dracula",
-]
+)
 
 # Display names for UI
 THEME_DISPLAY_NAMES = {
@@ -27,7 +27,7 @@ THEME_DISPLAY_NAMES = {
 
 # === Theme Definitions using Textual's Theme class ===
 
-THEMES: list[Theme] = [
+THEMES: tuple[Theme, ...] = (
     # Tokyo Night - 深邃的东京夜色，蓝紫色调
     Theme(
         name="delv-tokyo-night",
@@ -124,9 +124,9 @@ THEMES: list[Theme] = [
             "block-cursor-foreground": "#f8f8f2",
         },
     ),
-]
+)
 
 
-def get_themes() -> list[Theme]:
+def get_themes() -> tuple[Theme, ...]:
     """Get all Delv themes."""
     return THEMES
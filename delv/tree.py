@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Iterator
+from typing import Iterable, Iterator
 
 
 class NodeStatus(str, Enum):
@@ -18,15 +19,23 @@ class NodeStatus(str, Enum):
     @property
     def icon(self) -> str:
         """Get the icon for this status."""
-        return {
-            NodeStatus.ACTIVE: "►",
-            NodeStatus.DONE: "✓",
-            NodeStatus.DROPPED: "✗",
-            NodeStatus.TODO: "?",
-        }[self]
+        return _STATUS_ICONS[self]
+
+
+_STATUS_ICONS = {
+    NodeStatus.ACTIVE: "►",
+    NodeStatus.DONE: "✓",
+    NodeStatus.DROPPED: "✗",
+    NodeStatus.TODO: "?",
+}
+
+
+def _format_id(n: int) -> str:
+    """Format the n-th generated node ID, interned like IDs read from disk."""
+    return sys.intern(f"n{n}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """A node in the exploration tree."""
     
@@ -54,19 +63,24 @@ class Node:
     
     @classmethod
     def from_dict(cls, data: dict) -> "Node":
-        """Create node from dictionary."""
+        """Create node from dictionary.
+        
+        IDs are interned so the same id shared by a node, its parent's
+        children list and any links is one string object.
+        """
+        parent = data.get("parent")
         return cls(
-            id=data["id"],
+            id=sys.intern(data["id"]),
             title=data["title"],
             status=NodeStatus(data.get("status", "active")),
-            parent=data.get("parent"),
-            children=data.get("children", []),
+            parent=sys.intern(parent) if parent else parent,
+            children=[sys.intern(c) for c in data.get("children", [])],
             body=data.get("body", ""),
-            links=data.get("links", []),
+            links=[sys.intern(t) for t in data.get("links", [])],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplorationTree:
     """An exploration tree."""
     
@@ -78,35 +92,70 @@ class ExplorationTree:
     history: list[str] = field(default_factory=list)
     nodes: dict[str, Node] = field(default_factory=dict)
     
+    # Derived lookup indexes, built on first query and dropped on mutation
+    _by_status: dict[NodeStatus, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Leaf ids as an insertion-ordered set, so a parent can be dropped in O(1)
+    _leaves: dict[str, None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _backlinks: dict[str, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _max_depth: int | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Child id -> position in its parent's children, filled one parent at a time
+    _sibling_pos: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Bumped by every mutation; unlike `updated` it can't repeat within a clock tick
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    # Node id -> (title, body, lowercased title, lowercased body) for search
+    _search_text: dict[str, tuple[str, str, str, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
     def __post_init__(self):
         """Ensure root node exists."""
         if "root" not in self.nodes:
             self.nodes["root"] = Node(id="root", title="Root")
             self.history = ["root"]
     
-    def to_dict(self) -> dict:
-        """Convert tree to dictionary."""
+    def header_to_dict(self, raw_datetimes: bool = False) -> dict:
+        """
+        Convert tree metadata (everything except nodes) to dictionary.
+        
+        With raw_datetimes, created/updated are left as datetime objects for
+        serializers that write them as ISO-8601 themselves.
+        """
         return {
             "name": self.name,
-            "created": self.created.isoformat(),
-            "updated": self.updated.isoformat(),
+            "created": self.created if raw_datetimes else self.created.isoformat(),
+            "updated": self.updated if raw_datetimes else self.updated.isoformat(),
             "current": self.current,
             "nextId": self.next_id,
             "history": self.history,
-            "nodes": {k: v.to_dict() for k, v in self.nodes.items()},
         }
     
+    def to_dict(self) -> dict:
+        """Convert tree to dictionary."""
+        data = self.header_to_dict()
+        data["nodes"] = {k: v.to_dict() for k, v in self.nodes.items()}
+        return data
+    
     @classmethod
     def from_dict(cls, data: dict) -> "ExplorationTree":
         """Create tree from dictionary."""
-        nodes = {k: Node.from_dict(v) for k, v in data.get("nodes", {}).items()}
+        nodes = {sys.intern(k): Node.from_dict(v) for k, v in data.get("nodes", {}).items()}
         tree = cls(
             name=data["name"],
             created=datetime.fromisoformat(data["created"]),
             updated=datetime.fromisoformat(data["updated"]),
-            current=data.get("current", "root"),
+            current=sys.intern(data.get("current", "root")),
             next_id=data.get("nextId", 1),
-            history=data.get("history", ["root"]),
+            history=[sys.intern(h) for h in data.get("history", ["root"])],
             nodes=nodes,
         )
         return tree
@@ -128,8 +177,59 @@ class ExplorationTree:
         return tree
     
     def touch(self) -> None:
-        """Update the modified timestamp."""
+        """Update the modified timestamp and the mutation counter."""
         self.updated = datetime.now()
+        self._version += 1
+    
+    def _build_indexes(self) -> None:
+        """Build the status and leaf indexes in one pass over the nodes."""
+        by_status: dict[NodeStatus, list[str]] = {status: [] for status in NodeStatus}
+        leaves: dict[str, None] = {}
+        for nid, node in self.nodes.items():
+            by_status[node.status].append(nid)
+            if not node.children:
+                leaves[nid] = None
+        self._by_status = by_status
+        self._leaves = leaves
+    
+    def _invalidate_indexes(self) -> None:
+        """Drop derived indexes after a structure change."""
+        self._by_status = None
+        self._leaves = None
+        self._max_depth = None
+        self._sibling_pos = {}
+    
+    def _index_new_node(self, node: Node, parent: Node) -> None:
+        """Add a node just appended to self.nodes to the cached indexes."""
+        # New nodes come last in node order, so appending keeps the indexes ordered
+        if self._by_status is not None:
+            self._by_status[node.status].append(node.id)
+        if self._leaves is not None:
+            self._leaves[node.id] = None
+            if len(parent.children) == 1:
+                self._leaves.pop(parent.id, None)
+        if self._max_depth is not None:
+            self._max_depth = max(self._max_depth, len(self.get_path_to_root(node.id)))
+    
+    def _sibling_index(self, parent: Node, node_id: str) -> int:
+        """Get the position of node_id among its parent's children."""
+        pos = self._sibling_pos.get(node_id)
+        if pos is None:
+            self._sibling_pos.update((cid, i) for i, cid in enumerate(parent.children))
+            pos = self._sibling_pos[node_id]
+        return pos
+    
+    def _backlinks_index(self) -> dict[str, list[str]]:
+        """Map each link target to the nodes linking to it, in node order."""
+        if self._backlinks is None:
+            backlinks: dict[str, list[str]] = {}
+            for nid, node in self.nodes.items():
+                for lid in node.links:
+                    sources = backlinks.setdefault(lid, [])
+                    if not sources or sources[-1] != nid:
+                        sources.append(nid)
+            self._backlinks = backlinks
+        return self._backlinks
     
     def get_node(self, node_id: str) -> Node | None:
         """Get a node by ID."""
@@ -141,7 +241,7 @@ class ExplorationTree:
     
     def generate_id(self) -> str:
         """Generate a new node ID."""
-        node_id = f"n{self.next_id}"
+        node_id = _format_id(self.next_id)
         self.next_id += 1
         return node_id
     
@@ -155,6 +255,8 @@ class ExplorationTree:
         node = Node(id=node_id, title=title, parent=parent_id)
         self.nodes[node_id] = node
         parent.children.append(node_id)
+        # Appending leaves existing sibling positions valid
+        self._index_new_node(node, parent)
         
         if enter:
             self.go_to(node_id)
@@ -174,8 +276,10 @@ class ExplorationTree:
         self.nodes[node_id] = node
         
         # Insert after sibling
-        idx = parent.children.index(sibling_id)
+        idx = self._sibling_index(parent, sibling_id)
         parent.children.insert(idx + 1, node_id)
+        self._index_new_node(node, parent)
+        self._sibling_pos = {}
         
         if enter:
             self.go_to(node_id)
@@ -216,7 +320,7 @@ class ExplorationTree:
             return False
         
         parent = self.nodes[node.parent]
-        idx = parent.children.index(node.id)
+        idx = self._sibling_index(parent, node.id)
         if idx + 1 < len(parent.children):
             self.go_to(parent.children[idx + 1])
             return True
@@ -229,7 +333,7 @@ class ExplorationTree:
             return False
         
         parent = self.nodes[node.parent]
-        idx = parent.children.index(node.id)
+        idx = self._sibling_index(parent, node.id)
         if idx > 0:
             self.go_to(parent.children[idx - 1])
             return True
@@ -248,18 +352,23 @@ class ExplorationTree:
             return True
         return False
     
-    def set_status(self, node_id: str, status: NodeStatus, auto_up: bool = True) -> None:
-        """Set the status of a node."""
+    def set_status(self, node_id: str, status: NodeStatus, auto_up: bool = True) -> bool:
+        """Set the status of a node. Returns True if the tree changed."""
         node = self.nodes.get(node_id)
         if not node:
             raise ValueError(f"Node {node_id} not found")
         
-        node.status = status
+        changed = node.status != status
+        if changed:
+            node.status = status
+            self._by_status = None
+            self.touch()
         
         if auto_up and status in (NodeStatus.DONE, NodeStatus.DROPPED):
-            self.go_up()
+            # go_up touches the tree itself when it moves
+            changed = self.go_up() or changed
         
-        self.touch()
+        return changed
     
     def update_node(self, node_id: str, title: str | None = None, 
                     body: str | None = None, status: NodeStatus | None = None,
@@ -273,10 +382,12 @@ class ExplorationTree:
             node.title = title
         if body is not None:
             node.body = body
-        if status is not None:
+        if status is not None and status != node.status:
             node.status = status
+            self._by_status = None
         if links is not None:
             node.links = links
+            self._backlinks = None
         
         self.touch()
     
@@ -305,6 +416,12 @@ class ExplorationTree:
         
         if to_id not in from_node.links:
             from_node.links.append(to_id)
+            if self._backlinks is not None:
+                if to_id in self._backlinks:
+                    # Finding from_id's place in node order needs a scan; rebuild on demand
+                    self._backlinks = None
+                else:
+                    self._backlinks[to_id] = [from_id]
             self.touch()
     
     def remove_link(self, from_id: str, to_id: str) -> None:
@@ -315,15 +432,17 @@ class ExplorationTree:
         
         if to_id in from_node.links:
             from_node.links.remove(to_id)
+            # A hand-edited file may list a target twice; from_id is listed once either way
+            if self._backlinks is not None and to_id not in from_node.links:
+                sources = self._backlinks[to_id]
+                sources.remove(from_id)
+                if not sources:
+                    del self._backlinks[to_id]
             self.touch()
     
     def get_backlinks(self, node_id: str) -> list[str]:
         """Get all nodes that link to the specified node."""
-        backlinks = []
-        for nid, node in self.nodes.items():
-            if node_id in node.links:
-                backlinks.append(nid)
-        return backlinks
+        return list(self._backlinks_index().get(node_id, ()))
     
     def move_node(self, node_id: str, new_parent_id: str) -> None:
         """Move a node to a new parent."""
@@ -339,6 +458,8 @@ class ExplorationTree:
             raise ValueError(f"Node {new_parent_id} not found")
         
         # Check for circular reference
+        if new_parent_id == node_id:
+            raise ValueError("Cannot move node under itself")
         if self._is_ancestor(node_id, new_parent_id):
             raise ValueError("Cannot move node under its own descendant")
         
@@ -350,6 +471,7 @@ class ExplorationTree:
         # Add to new parent
         node.parent = new_parent_id
         new_parent.children.append(node_id)
+        self._invalidate_indexes()
         
         self.touch()
     
@@ -381,31 +503,38 @@ class ExplorationTree:
             parent.children.remove(node_id)
         
         # Remove all links to deleted nodes
+        backlinks = self._backlinks_index()
         for nid in to_delete:
-            for other in self.nodes.values():
-                if nid in other.links:
-                    other.links.remove(nid)
+            for source_id in backlinks.get(nid, ()):
+                self.nodes[source_id].links.remove(nid)
         
         # Delete nodes
         for nid in to_delete:
             del self.nodes[nid]
-        
-        # Update current if deleted
-        if self.current in to_delete:
+            self._search_text.pop(nid, None)
+        self._invalidate_indexes()
+        self._backlinks = None
+        
+        # Update current if deleted, and drop deleted nodes from history so
+        # go_back can't land on one; a set keeps the filter one pass
+        deleted = set(to_delete)
+        if self.current in deleted:
             self.current = node.parent or "root"
-            self.history = [h for h in self.history if h not in to_delete]
-            if not self.history:
-                self.history = ["root"]
+        self.history = [h for h in self.history if h not in deleted]
+        if not self.history:
+            self.history = ["root"]
         
         self.touch()
     
     def _collect_descendants(self, node_id: str, result: list[str]) -> None:
-        """Collect a node and all its descendants."""
-        result.append(node_id)
-        node = self.nodes.get(node_id)
-        if node:
-            for child_id in node.children:
-                self._collect_descendants(child_id, result)
+        """Collect a node and all its descendants in DFS pre-order."""
+        stack = [node_id]
+        while stack:
+            nid = stack.pop()
+            result.append(nid)
+            node = self.nodes.get(nid)
+            if node:
+                stack.extend(reversed(node.children))
     
     def copy_subtree(self, node_id: str, new_parent_id: str) -> str:
         """Copy a node and its subtree to a new parent. Returns new root ID."""
@@ -417,56 +546,82 @@ class ExplorationTree:
         if not new_parent:
             raise ValueError(f"Node {new_parent_id} not found")
         
-        return self._copy_node_recursive(node_id, new_parent_id)
-    
-    def _copy_node_recursive(self, node_id: str, parent_id: str) -> str:
-        """Recursively copy a node and its children."""
-        node = self.nodes[node_id]
-        new_id = self.generate_id()
-        
-        new_node = Node(
-            id=new_id,
-            title=node.title,
-            status=node.status,
-            parent=parent_id,
-            children=[],
-            body=node.body,
-            links=list(node.links),
-        )
-        
-        self.nodes[new_id] = new_node
-        self.nodes[parent_id].children.append(new_id)
-        
-        for child_id in node.children:
-            self._copy_node_recursive(child_id, new_id)
-        
-        self.touch()
+        new_id = self._copy_nodes(node_id, new_parent_id)
+        self._invalidate_indexes()
+        self._backlinks = None
         return new_id
     
-    def search(self, pattern: str) -> list[str]:
-        """Search for nodes matching the pattern in title or body."""
+    def _copy_nodes(self, node_id: str, parent_id: str) -> str:
+        """Copy a node and its descendants under parent_id. Returns the new ID."""
+        # Snapshot the subtree first, so copying a node under its own
+        # descendant doesn't walk into the copies
+        source: list[str] = []
+        self._collect_descendants(node_id, source)
+        
+        # Reserve the whole ID range at once (same scheme as generate_id);
+        # pre-order keeps the numbering identical to copying one at a time
+        first_id = self.next_id
+        self.next_id += len(source)
+        new_ids = {src_id: _format_id(first_id + i) for i, src_id in enumerate(source)}
+        
+        for src_id in source:
+            node = self.nodes[src_id]
+            new_id = new_ids[src_id]
+            self.nodes[new_id] = Node(
+                id=new_id,
+                title=node.title,
+                status=node.status,
+                parent=parent_id if src_id == node_id else new_ids[node.parent],
+                children=[new_ids[child_id] for child_id in node.children],
+                body=node.body,
+                links=list(node.links),
+            )
+        
+        self.nodes[parent_id].children.append(new_ids[node_id])
+        self.touch()
+        return new_ids[node_id]
+    
+    def search(self, pattern: str, within: Iterable[str] | None = None) -> list[str]:
+        """Search for nodes matching the pattern in title or body.
+        
+        If within is given, only those node IDs are checked, in that order.
+        """
         pattern_lower = pattern.lower()
+        cache = self._search_text
+        nodes = self.nodes
+        candidates = nodes.items() if within is None else ((nid, nodes[nid]) for nid in within)
         results = []
-        for nid, node in self.nodes.items():
-            if pattern_lower in node.title.lower() or pattern_lower in node.body.lower():
+        for nid, node in candidates:
+            # Lowercased text is reused until the title or body string is replaced
+            entry = cache.get(nid)
+            if entry is None or entry[0] is not node.title or entry[1] is not node.body:
+                entry = (node.title, node.body, node.title.lower(), node.body.lower())
+                cache[nid] = entry
+            if pattern_lower in entry[2] or pattern_lower in entry[3]:
                 results.append(nid)
         return results
     
     def find_by_status(self, status: NodeStatus) -> list[str]:
         """Find all nodes with the given status."""
-        return [nid for nid, node in self.nodes.items() if node.status == status]
+        if self._by_status is None:
+            self._build_indexes()
+        return list(self._by_status[status])
     
     def find_leaves(self) -> list[str]:
         """Find all leaf nodes (nodes with no children)."""
-        return [nid for nid, node in self.nodes.items() if not node.children]
+        if self._leaves is None:
+            self._build_indexes()
+        return list(self._leaves)
     
     def find_orphans(self) -> list[str]:
         """Find leaf nodes with no links."""
-        orphans = []
-        for nid, node in self.nodes.items():
-            if not node.children and not node.links and not self.get_backlinks(nid):
-                orphans.append(nid)
-        return orphans
+        if self._leaves is None:
+            self._build_indexes()
+        backlinks = self._backlinks_index()
+        return [
+            nid for nid in self._leaves
+            if not self.nodes[nid].links and nid not in backlinks
+        ]
     
     def get_path_to_root(self, node_id: str) -> list[str]:
         """Get the path from root to the specified node."""
@@ -488,36 +643,36 @@ class ExplorationTree:
     
     def get_statistics(self) -> dict:
         """Get statistics about the tree."""
+        # Counts come from the status/leaf indexes, so repeated calls
+        # between edits don't tally nodes again
+        if self._by_status is None:
+            self._build_indexes()
+        by_status = self._by_status
         stats = {
             "total": len(self.nodes),
-            "active": 0,
-            "done": 0,
-            "dropped": 0,
-            "todo": 0,
-            "leaves": 0,
+            "active": len(by_status[NodeStatus.ACTIVE]),
+            "done": len(by_status[NodeStatus.DONE]),
+            "dropped": len(by_status[NodeStatus.DROPPED]),
+            "todo": len(by_status[NodeStatus.TODO]),
+            "leaves": len(self._leaves),
             "max_depth": 0,
         }
         
-        for node in self.nodes.values():
-            stats[node.status.value] += 1
-            if not node.children:
-                stats["leaves"] += 1
-        
-        # Calculate max depth
-        for nid in self.nodes:
-            depth = len(self.get_path_to_root(nid))
-            stats["max_depth"] = max(stats["max_depth"], depth)
+        # Depths come from one DFS instead of a walk to the root per node;
+        # max_depth counts levels, so root alone is 1
+        if self._max_depth is None:
+            self._max_depth = max(depth for _, depth in self.iter_tree()) + 1
+        stats["max_depth"] = self._max_depth
         
         return stats
     
     def iter_tree(self, start: str = "root") -> Iterator[tuple[str, int]]:
         """Iterate through the tree in DFS order, yielding (node_id, depth)."""
-        def _iter(node_id: str, depth: int):
+        stack = [(start, 0)]
+        while stack:
+            node_id, depth = stack.pop()
             yield node_id, depth
             node = self.nodes.get(node_id)
             if node:
-                for child_id in node.children:
-                    yield from _iter(child_id, depth + 1)
-        
-        yield from _iter(start, 0)
+                stack.extend((child_id, depth + 1) for child_id in reversed(node.children))
 
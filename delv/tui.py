@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-import pyperclip
+import asyncio
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib import resources
+
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.command import Hit, Hits, Provider
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
+from textual.message import Message
 from textual.screen import ModalScreen
 from textual.widgets import (
     Footer,
@@ -21,18 +27,21 @@ from textual.widgets import (
     Tree,
 )
 from textual.suggester import Suggester
+from textual.timer import Timer
 from textual.widgets.option_list import Option
 from textual.widgets.tree import TreeNode
 
 from .config import Config, get_current_tree_name, set_current_tree_name
-from .editor import edit_node_interactive
 from .storage import (
     delete_tree,
+    encode_tree,
+    get_tree_path,
     list_trees,
     load_tree,
     rename_tree,
     save_tree,
     tree_exists,
+    write_tree_data,
 )
 from .themes import THEME_DISPLAY_NAMES, THEME_NAMES, get_themes
 from .tree import ExplorationTree, Node, NodeStatus
@@ -46,18 +55,49 @@ class NodeIdSuggester(Suggester):
     def __init__(self, tree: ExplorationTree, case_sensitive: bool = False) -> None:
         super().__init__(case_sensitive=case_sensitive)
         self._tree = tree
+        self._prefixes: dict[str, tuple[str, ...]] | None = None
+        self._ids_key: tuple[int, int] | None = None
+    
+    def _current_ids_key(self) -> tuple[int, int]:
+        # IDs are only minted from next_id and never renamed, so this pair
+        # changes whenever a node is added or removed
+        return (self._tree.next_id, len(self._tree.nodes))
+    
+    def refresh(self) -> None:
+        """Drop cached completions if nodes were added or removed since they were built."""
+        if self._ids_key != self._current_ids_key():
+            self._prefixes = None
+            self._ids_key = None
+            if self.cache is not None:
+                self.cache.clear()
+    
+    def _build_prefixes(self) -> dict[str, tuple[str, ...]]:
+        """Map every ID prefix to the first two IDs (in node order) that start with it."""
+        # Two is enough: at most one ID can equal the typed value
+        prefixes: dict[str, tuple[str, ...]] = {}
+        for nid in self._tree.nodes:
+            key = nid if self.case_sensitive else nid.lower()
+            for end in range(1, len(key) + 1):
+                prefix = key[:end]
+                found = prefixes.get(prefix, ())
+                if len(found) < 2:
+                    prefixes[prefix] = found + (nid,)
+        return prefixes
     
     async def get_suggestion(self, value: str) -> str | None:
         """Get a completion suggestion for the given input."""
         if not value:
             return None
         
+        if self._prefixes is None:
+            self._prefixes = self._build_prefixes()
+            self._ids_key = self._current_ids_key()
+        
         value_lower = value.lower() if not self.case_sensitive else value
         
         # Find matching node IDs
-        for nid in self._tree.nodes:
-            nid_cmp = nid.lower() if not self.case_sensitive else nid
-            if nid_cmp.startswith(value_lower) and nid != value:
+        for nid in self._prefixes.get(value_lower, ()):
+            if nid != value:
                 return nid
         
         return None
@@ -65,130 +105,105 @@ class NodeIdSuggester(Suggester):
 
 # === Command Palette Provider ===
 
+# (name, description, app action method) for every palette command
+_COMMANDS: tuple[tuple[str, str, str], ...] = (
+    ("添加子节点", "创建新的子节点", "action_add_child"),
+    ("添加兄弟节点", "创建同级节点", "action_add_sibling"),
+    ("编辑节点", "使用外部编辑器编辑", "action_edit_external"),
+    ("编辑标题", "快速修改节点标题", "action_edit_title"),
+    ("追加内容", "向节点追加文本", "action_append_body"),
+    ("标记完成", "将节点标记为已完成", "action_mark_done"),
+    ("标记放弃", "将节点标记为已放弃", "action_mark_dropped"),
+    ("标记待办", "将节点标记为待办", "action_mark_todo"),
+    ("添加链接", "创建到其他节点的链接", "action_add_link"),
+    ("移除链接", "删除现有链接", "action_remove_link"),
+    ("显示反向链接", "查看指向此节点的链接", "action_show_backlinks"),
+    ("移动节点", "将节点移动到新位置", "action_move_node"),
+    ("复制内容", "复制节点内容到剪贴板", "action_yank_body"),
+    ("粘贴内容", "从剪贴板粘贴内容", "action_paste_body"),
+    ("复制节点ID", "复制节点ID到剪贴板", "action_yank_id"),
+    ("新建树", "创建新的探索树", "action_new_tree"),
+    ("重命名树", "重命名当前树", "action_rename_tree"),
+    ("删除树", "删除当前树", "action_delete_tree"),
+    ("搜索", "在树中搜索节点", "action_search"),
+    ("统计信息", "显示树的统计数据", "action_show_stats"),
+    ("切换主题", "更换界面主题", "action_select_theme"),
+    ("跳转到根节点", "返回根节点", "action_go_root"),
+    ("跳转到节点", "按ID跳转到节点", "action_goto_node"),
+    ("返回父节点", "向上导航一级", "action_go_parent"),
+    ("历史后退", "返回上一个访问的节点", "action_go_back"),
+    ("强制保存", "立即保存当前树", "action_force_save"),
+    ("帮助", "显示快捷键帮助", "action_show_help"),
+)
+
+
+def _build_char_commands() -> dict[str, int]:
+    """Map each character to a bitmask of the commands whose name has it.
+    
+    The fuzzy matcher needs every query character somewhere in the
+    (lowercased) name, so ANDing the masks of the query's characters leaves
+    exactly the commands that can score.
+    """
+    masks: dict[str, int] = {}
+    for bit, (name, _, _) in enumerate(_COMMANDS):
+        for char in set(name.lower()):
+            masks[char] = masks.get(char, 0) | (1 << bit)
+    return masks
+
+
+_CHAR_COMMANDS = _build_char_commands()
+_ALL_COMMANDS = (1 << len(_COMMANDS)) - 1
+
+
 class DelvCommands(Provider):
     """Command palette provider for Delv actions."""
     
     async def search(self, query: str) -> Hits:
         """Search for commands."""
         app = self.app
-        
-        # Define all available commands
-        commands = [
-            ("添加子节点", "创建新的子节点", app.action_add_child),
-            ("添加兄弟节点", "创建同级节点", app.action_add_sibling),
-            ("编辑节点", "使用外部编辑器编辑", app.action_edit_external),
-            ("编辑标题", "快速修改节点标题", app.action_edit_title),
-            ("追加内容", "向节点追加文本", app.action_append_body),
-            ("标记完成", "将节点标记为已完成", app.action_mark_done),
-            ("标记放弃", "将节点标记为已放弃", app.action_mark_dropped),
-            ("标记待办", "将节点标记为待办", app.action_mark_todo),
-            ("添加链接", "创建到其他节点的链接", app.action_add_link),
-            ("移除链接", "删除现有链接", app.action_remove_link),
-            ("显示反向链接", "查看指向此节点的链接", app.action_show_backlinks),
-            ("移动节点", "将节点移动到新位置", app.action_move_node),
-            ("复制内容", "复制节点内容到剪贴板", app.action_yank_body),
-            ("粘贴内容", "从剪贴板粘贴内容", app.action_paste_body),
-            ("复制节点ID", "复制节点ID到剪贴板", app.action_yank_id),
-            ("新建树", "创建新的探索树", app.action_new_tree),
-            ("重命名树", "重命名当前树", app.action_rename_tree),
-            ("删除树", "删除当前树", app.action_delete_tree),
-            ("搜索", "在树中搜索节点", app.action_search),
-            ("统计信息", "显示树的统计数据", app.action_show_stats),
-            ("切换主题", "更换界面主题", app.action_select_theme),
-            ("跳转到根节点", "返回根节点", app.action_go_root),
-            ("跳转到节点", "按ID跳转到节点", app.action_goto_node),
-            ("返回父节点", "向上导航一级", app.action_go_parent),
-            ("历史后退", "返回上一个访问的节点", app.action_go_back),
-            ("强制保存", "立即保存当前树", app.action_force_save),
-            ("帮助", "显示快捷键帮助", app.action_show_help),
-        ]
+        candidates = _ALL_COMMANDS
+        for char in set(query.lower()):
+            candidates &= _CHAR_COMMANDS.get(char, 0)
+            if not candidates:
+                return
         
         matcher = self.matcher(query)
-        
-        for name, description, callback in commands:
+        for bit, (name, description, action) in enumerate(_COMMANDS):
+            if not candidates >> bit & 1:
+                continue
             score = matcher.match(name)
             if score > 0:
+                # Passing text spares Hit from flattening the highlight back to str
                 yield Hit(
                     score,
                     matcher.highlight(name),
-                    callback,
+                    getattr(app, action),
+                    text=name,
                     help=description,
                 )
 
 
 # === Help Text ===
 
-HELP_FULL = """# Delv 快捷键
+def _load_help_text() -> str:
+    """Read the full help Markdown shipped alongside this module."""
+    return resources.files(__package__).joinpath("help.md").read_text(encoding="utf-8")
 
-## 速查
-| 操作 | 快捷键 |
-|------|--------|
-| 方向移动 | `h` `j` `k` `l` |
-| 进入/选择 | `Enter` |
-| 返回父节点 | `Backspace` |
-| 历史后退 | `-` |
-| 添加子节点 | `a` |
-| 编辑节点 | `e` |
-| 标记完成 | `d` |
-| 搜索 | `/` |
 
----
+# === Clipboard ===
 
-## 导航
-| 快捷键 | 操作 |
-|--------|------|
-| `h` `l` | 切换面板焦点 (左/右) |
-| `j` `k` | 上下移动 |
-| `Enter` | 进入节点 / 打开树 |
-| `Backspace` | 返回父节点 |
-| `-` | 历史后退 |
-| `r` | 跳转到根节点 |
-| `g` | 按 ID 跳转 |
-| `]` `[` | 跳转到下/上一个链接 |
+# Terminals that accept OSC 52 clipboard writes out of the box
+_OSC52_TERM_PROGRAMS = frozenset({"iTerm.app", "WezTerm", "ghostty"})
+_OSC52_TERMS = ("xterm-kitty", "alacritty", "foot", "xterm-ghostty", "wezterm")
 
-## 编辑
-| 快捷键 | 操作 |
-|--------|------|
-| `a` | 添加子节点 |
-| `A` | 添加兄弟节点 |
-| `e` | 编辑节点 (外部编辑器) |
-| `E` | 快速编辑标题 |
-| `i` | 快速追加内容 |
-| `d` | 标记完成 (自动返回) |
-| `x` | 标记放弃 (自动返回) |
-| `t` | 标记待办 |
 
-## 链接与结构
-| 快捷键 | 操作 |
-|--------|------|
-| `L` | 添加链接 |
-| `U` | 移除链接 |
-| `B` | 显示反向链接 |
-| `m` | 移动节点 |
-| `y` | 复制内容到剪贴板 |
-| `p` | 粘贴到内容 |
-| `Y` | 复制节点 ID |
-
-## 树管理
-| 快捷键 | 操作 |
-|--------|------|
-| `n` | 新建树 |
-| `R` | 重命名树 |
-| `D` | 删除树 |
-
-## 其他
-| 快捷键 | 操作 |
-|--------|------|
-| `Ctrl+P` | **命令面板** (模糊搜索所有命令) |
-| `/` | 搜索 |
-| `s` | 统计信息 |
-| `T` | 切换主题 |
-| `?` | 帮助 |
-| `Ctrl+S` | 强制保存 |
-| `q` | 退出 |
-
-> **提示**: 按 `Ctrl+P` 打开命令面板，可以模糊搜索所有可用命令！
-"""
+def _terminal_clipboard() -> bool:
+    """Whether the terminal is known to accept OSC 52, so a copy can skip pyperclip."""
+    env = os.environ
+    return (
+        env.get("TERM_PROGRAM") in _OSC52_TERM_PROGRAMS
+        or env.get("TERM", "").startswith(_OSC52_TERMS)
+    )
 
 
 # === Screens ===
@@ -204,7 +219,7 @@ class HelpScreen(ModalScreen):
     def compose(self) -> ComposeResult:
         # MarkdownViewer has built-in scrolling and keyboard navigation
         yield Container(
-            MarkdownViewer(HELP_FULL, show_table_of_contents=False, id="help-viewer"),
+            MarkdownViewer(_load_help_text(), show_table_of_contents=False, id="help-viewer"),
             id="help-container",
         )
     
@@ -291,10 +306,19 @@ class SearchScreen(ModalScreen[str | None]):
         Binding("escape", "cancel", "取消"),
     ]
     
+    # Keystrokes closer together than this are coalesced into one search
+    SEARCH_DELAY = 0.1
+    
     def __init__(self, tree: ExplorationTree) -> None:
         super().__init__()
         self.current_tree = tree
         self.results: list[str] = []
+        self._search_timer: Timer | None = None
+        self._shown_ids: list[str] = []  # IDs currently in the results list
+        # Results per lowercased query, valid while tree._version is unchanged
+        self._result_cache: dict[str, list[str]] = {}
+        self._cache_version: int | None = None
+        self._last_key: str = ""
     
     def compose(self) -> ComposeResult:
         yield Container(
@@ -309,21 +333,71 @@ class SearchScreen(ModalScreen[str | None]):
     
     @on(Input.Changed)
     def on_search_changed(self, event: Input.Changed) -> None:
-        results_view = self.query_one("#search-results", OptionList)
-        results_view.clear_options()
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
         
         query = event.value.strip()
         if not query:
-            self.results = []
-            return
+            self._run_search(query)
+        else:
+            self._search_timer = self.set_timer(
+                self.SEARCH_DELAY, lambda: self._run_search(query)
+            )
+    
+    def _run_search(self, query: str) -> None:
+        self._search_timer = None
+        self.results = self._search(query) if query else []
+        self._show_results(self.results[:20])  # Limit to 20 results
+    
+    def _search(self, query: str) -> list[str]:
+        """Search the tree, reusing earlier results while it is unchanged."""
+        tree = self.current_tree
+        if self._cache_version != tree._version:
+            self._result_cache.clear()
+            self._cache_version = tree._version
+        
+        key = query.lower()
+        results = self._result_cache.get(key)
+        if results is None:
+            # Typing more only narrows a substring match, so check just the
+            # nodes the previous query matched
+            within = self._result_cache.get(self._last_key) if self._last_key in key else None
+            results = tree.search(query, within)
+            self._result_cache[key] = results
+        self._last_key = key
+        return results
+    
+    def _show_results(self, ids: list[str]) -> None:
+        """Update the results list, keeping the rows it already shares with ids."""
+        results_view = self.query_one("#search-results", OptionList)
+        shown = self._shown_ids
+        keep = 0
+        for old, new in zip(shown, ids):
+            if old != new:
+                break
+            keep += 1
         
-        self.results = self.current_tree.search(query)
-        for nid in self.results[:20]:  # Limit to 20 results
-            node = self.current_tree.nodes[nid]
-            results_view.add_option(Option(f"[{nid}] {node.status.icon} {node.title}", id=nid))
+        if keep == 0:
+            results_view.clear_options()
+        else:
+            for index in range(len(shown) - 1, keep - 1, -1):
+                results_view.remove_option_at_index(index)
+        
+        nodes = self.current_tree.nodes
+        results_view.add_options(
+            Option(f"[{nid}] {nodes[nid].status.icon} {nodes[nid].title}", id=nid)
+            for nid in ids[keep:]
+        )
+        self._shown_ids = ids
     
     @on(Input.Submitted)
     def on_search_submit(self, event: Input.Submitted) -> None:
+        if self._search_timer is not None:
+            # Enter pressed before the pending search ran
+            self._search_timer.stop()
+            self._run_search(event.value.strip())
+        
         if self.results:
             self.dismiss(self.results[0])
         else:
@@ -345,21 +419,51 @@ class SelectNodeScreen(ModalScreen[str | None]):
         Binding("escape", "cancel", "取消"),
     ]
     
-    def __init__(self, tree: ExplorationTree, prompt: str, exclude: str | None = None) -> None:
+    # (id, display) rows of the last listing, with the tree (held, so its
+    # identity can't be reused), its mutation counter and the excluded nodes;
+    # reused while the tree is unchanged
+    _rows_cache: tuple[ExplorationTree, int, frozenset[str], list[tuple[str, str]]] | None = None
+    
+    def __init__(
+        self, tree: ExplorationTree, prompt: str, exclude: str | Iterable[str] | None = None
+    ) -> None:
         super().__init__()
         self.current_tree = tree
         self.prompt = prompt
-        self.exclude = exclude
-    
-    def compose(self) -> ComposeResult:
-        # Build options from tree
-        options = []
-        for nid, depth in self.current_tree.iter_tree():
-            if nid == self.exclude:
+        # A single node ID or any collection of IDs to leave out of the list
+        if exclude is None:
+            self.exclude: frozenset[str] = frozenset()
+        elif isinstance(exclude, str):
+            self.exclude = frozenset((exclude,))
+        else:
+            self.exclude = frozenset(exclude)
+    
+    def _rows(self) -> list[tuple[str, str]]:
+        tree = self.current_tree
+        exclude = self.exclude
+        version = tree._version
+        cached = SelectNodeScreen._rows_cache
+        if (
+            cached is not None
+            and cached[0] is tree
+            and cached[1] == version
+            and cached[2] == exclude
+        ):
+            return cached[3]
+        
+        rows = []
+        for nid, depth in tree.iter_tree():
+            if nid in exclude:
                 continue
-            node = self.current_tree.nodes[nid]
+            node = tree.nodes[nid]
             indent = "  " * depth
-            options.append(Option(f"{indent}[{nid}] {node.status.icon} {node.title}", id=nid))
+            rows.append((nid, f"{indent}[{nid}] {node.status.icon} {node.title}"))
+        SelectNodeScreen._rows_cache = (tree, version, exclude, rows)
+        return rows
+    
+    def compose(self) -> ComposeResult:
+        # Option objects belong to one list, so only the formatted rows are shared
+        options = [Option(display, id=nid) for nid, display in self._rows()]
         
         yield Container(
             Label(self.prompt, id="select-prompt"),
@@ -464,6 +568,11 @@ class StatisticsScreen(ModalScreen):
         self.app.pop_screen()
 
 
+# (name, display name) per theme, and each theme's row in the selector
+_THEME_LABELS = tuple((name, THEME_DISPLAY_NAMES.get(name, name)) for name in THEME_NAMES)
+_THEME_INDEX = {name: i for i, name in enumerate(THEME_NAMES)}
+
+
 class ThemeSelectorScreen(ModalScreen[str | None]):
     """Modal screen for selecting a theme."""
     
@@ -481,11 +590,8 @@ class ThemeSelectorScreen(ModalScreen[str | None]):
             Label("选择主题", id="theme-title"),
             OptionList(
                 *[
-                    Option(
-                        f"{'► ' if name == self.current_theme else '  '}{THEME_DISPLAY_NAMES.get(name, name)}",
-                        id=name,
-                    )
-                    for name in THEME_NAMES
+                    Option(f"{'► ' if name == self.current_theme else '  '}{label}", id=name)
+                    for name, label in _THEME_LABELS
                 ],
                 id="theme-list",
             ),
@@ -496,10 +602,9 @@ class ThemeSelectorScreen(ModalScreen[str | None]):
     def on_mount(self) -> None:
         option_list = self.query_one("#theme-list", OptionList)
         # Highlight current theme
-        for i, name in enumerate(THEME_NAMES):
-            if name == self.current_theme:
-                option_list.highlighted = i
-                break
+        index = _THEME_INDEX.get(self.current_theme)
+        if index is not None:
+            option_list.highlighted = index
         option_list.focus()
     
     @on(OptionList.OptionSelected)
@@ -521,6 +626,10 @@ class DelvApp(App):
     # Enable command palette with custom provider
     COMMANDS = {DelvCommands}
     
+    # Named screens are created on first push and then kept installed, so the
+    # help Markdown is parsed once per session rather than on every open
+    SCREENS = {"help": HelpScreen}
+    
     # Enable command palette toggle
     ENABLE_COMMAND_PALETTE = True
     
@@ -581,7 +690,24 @@ class DelvApp(App):
         self.current_trees_list: list[str] = []
         self.focus_panel: int = 1  # 0=trees, 1=nodes, 2=content
         self.link_index: int = 0
-        self._updating_tree: bool = False  # Prevent recursive updates
+        self._id_suggester: NodeIdSuggester | None = None
+        self._tree_node_index: dict[str, TreeNode] = {}  # node ID -> its row in #node-tree
+        self._row_labels: dict[str, str] = {}  # node ID -> label text last set on its row
+        self._rows_tree: ExplorationTree | None = None  # Tree the rows were built from
+        # (tree names, current name) last shown in #trees-list
+        self._trees_list_state: tuple[tuple[str, ...], str | None] = ((), None)
+        self._body_source: str | None = None  # Markdown last shown in #node-body
+        self._content_pending: bool = False  # A deferred refresh_content is queued
+        self._cursor_pending: bool = False  # A deferred _place_cursor is queued
+        # (tree, current node, tree._version) the content panel last showed
+        self._content_key: tuple[ExplorationTree, str, int] | tuple[None] | None = None
+        # Recently left trees by name, with the (mtime, size) of their file
+        self._tree_cache: dict[str, tuple[tuple[int, int], ExplorationTree]] = {}
+        self._load_token: int = 0  # Bumped per load, so a stale result is dropped
+        self._save_pending: ExplorationTree | None = None  # Tree with unsaved changes
+        self._save_timer: Timer | None = None
+        # One writer thread, so saves land on disk in the order they were made
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="delv-save")
         
         # Register custom themes
         for theme in get_themes():
@@ -601,33 +727,47 @@ class DelvApp(App):
         self.load_current_tree()
         self.update_focus()
     
+    def on_unmount(self) -> None:
+        self.flush_save(wait=True, sync=True)
+        self._save_executor.shutdown()
+    
     def compose(self) -> ComposeResult:
+        # Keep references to the widgets the actions and refreshes work on,
+        # instead of looking them up by selector on every keystroke
+        self._trees_view = OptionList(id="trees-list")
+        self._tree_widget: Tree[str] = Tree("root", id="node-tree")
+        self._title_widget = Static("", id="node-title")
+        self._meta_widget = Static("", id="node-meta")
+        self._body_widget = Markdown("", id="node-body")
+        self._links_widget = Static("", id="links-section")
+        self._content_scroll = VerticalScroll(
+            Container(
+                self._title_widget,
+                self._meta_widget,
+                id="node-header",
+            ),
+            self._body_widget,
+            self._links_widget,
+            id="content-scroll",
+        )
+        
         yield Header()
         yield Horizontal(
             Vertical(
                 Static("树", classes="panel-title"),
-                OptionList(id="trees-list"),
+                self._trees_view,
                 id="trees-panel",
                 classes="panel",
             ),
             Vertical(
                 Static("节点", classes="panel-title"),
-                Tree("root", id="node-tree"),
+                self._tree_widget,
                 id="nodes-panel",
                 classes="panel",
             ),
             Vertical(
                 Static("内容", classes="panel-title"),
-                VerticalScroll(
-                    Container(
-                        Static("", id="node-title"),
-                        Static("", id="node-meta"),
-                        id="node-header",
-                    ),
-                    Markdown("", id="node-body"),
-                    Static("", id="links-section"),
-                    id="content-scroll",
-                ),
+                self._content_scroll,
                 id="content-panel",
                 classes="panel",
             ),
@@ -637,110 +777,303 @@ class DelvApp(App):
     
     
     def refresh_trees_list(self) -> None:
-        """Refresh the trees list."""
-        self.current_trees_list = list_trees()
-        trees_view = self.query_one("#trees-list", OptionList)
-        trees_view.clear_options()
-        
+        """Refresh the trees list, touching only the marker rows when just the current tree changed."""
+        names = tuple(list_trees())
         current_name = get_current_tree_name()
-        for name in self.current_trees_list:
-            prefix = "► " if name == current_name else "  "
-            trees_view.add_option(Option(f"{prefix}{name}", id=name))
+        old_names, old_current = self._trees_list_state
+        self._trees_list_state = (names, current_name)
+        self.current_trees_list = list(names)
+        trees_view = self._trees_view
+        
+        if names == old_names and trees_view.option_count == len(names):
+            if current_name != old_current:
+                for name in (old_current, current_name):
+                    if name in names:
+                        trees_view.replace_option_prompt_at_index(
+                            names.index(name), self._trees_list_prompt(name, current_name)
+                        )
+            return
+        
+        trees_view.clear_options()
+        trees_view.add_options(
+            Option(self._trees_list_prompt(name, current_name), id=name)
+            for name in names
+        )
+    
+    @staticmethod
+    def _trees_list_prompt(name: str, current_name: str | None) -> str:
+        return f"{'► ' if name == current_name else '  '}{name}"
+    
+    # Number of recently left trees kept in memory for quick switching back
+    TREE_CACHE_SIZE = 4
     
     def load_current_tree(self) -> None:
-        """Load the current tree."""
+        """Load the current tree, reading the file in a worker thread."""
+        self.flush_save(wait=True)
+        if self.current_tree:
+            self._remember_tree(self.current_tree)
+        
+        self._load_token += 1
         name = get_current_tree_name()
-        if name and tree_exists(name):
-            try:
-                self.current_tree = load_tree(name)
-                self.refresh_node_tree()
-                self.refresh_content()
-            except Exception:
-                self.current_tree = None
-        else:
-            self.current_tree = None
-            self.refresh_node_tree()
-            self.refresh_content()
+        if not (name and tree_exists(name)):
+            self._show_tree(None)
+            return
+        
+        cached = self._cached_tree(name)
+        if cached is not None:
+            self._show_tree(cached)
+            return
+        
+        self._show_tree(None)
+        self._tree_widget.root.set_label("(加载中…)")
+        self._load_tree_worker(name, self._load_token)
+    
+    @work(thread=True, exclusive=True, group="load")
+    def _load_tree_worker(self, name: str, token: int) -> None:
+        try:
+            tree = load_tree(name)
+        except Exception:
+            tree = None
+        self.call_from_thread(self._on_tree_loaded, tree, token)
+    
+    def _on_tree_loaded(self, tree: ExplorationTree | None, token: int) -> None:
+        if token == self._load_token:
+            self._show_tree(tree)
+    
+    def _show_tree(self, tree: ExplorationTree | None) -> None:
+        self.current_tree = tree
+        self.refresh_node_tree()
+        self.refresh_content()
+    
+    def _file_key(self, name: str) -> tuple[int, int] | None:
+        try:
+            stat = get_tree_path(name).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _remember_tree(self, tree: ExplorationTree) -> None:
+        """Keep a saved tree in memory while its file stays as it is."""
+        key = self._file_key(tree.name)
+        if key is None:
+            return
+        self._tree_cache.pop(tree.name, None)
+        self._tree_cache[tree.name] = (key, tree)
+        while len(self._tree_cache) > self.TREE_CACHE_SIZE:
+            del self._tree_cache[next(iter(self._tree_cache))]
+    
+    def _cached_tree(self, name: str) -> ExplorationTree | None:
+        """The remembered tree for name, if its file hasn't changed since."""
+        entry = self._tree_cache.pop(name, None)
+        if entry is None or entry[0] != self._file_key(name):
+            return None
+        return entry[1]
     
     def refresh_node_tree(self) -> None:
         """Refresh the node tree display."""
-        was_updating = self._updating_tree
-        self._updating_tree = True
-        try:
-            tree_widget = self.query_one("#node-tree", Tree)
+        # Moving the cursor here must not navigate
+        with self.prevent(Tree.NodeHighlighted):
+            if self.current_tree is not None and self._rows_tree is self.current_tree:
+                # Same tree as the rows were built from: patch only what changed
+                self._sync_node_rows()
+                self._select_tree_node(self.current_tree.current)
+                return
+            
+            tree_widget = self._tree_widget
             tree_widget.clear()
+            self._tree_node_index.clear()
+            self._row_labels.clear()
+            self._rows_tree = self.current_tree
             
             if not self.current_tree:
                 tree_widget.root.set_label("(未加载树)")
                 return
             
             root_node = self.current_tree.nodes["root"]
-            tree_widget.root.set_label(self._format_node_label(root_node))
+            root_label = self._format_node_label(root_node)
+            tree_widget.root.set_label(root_label)
             tree_widget.root.data = "root"
+            self._tree_node_index["root"] = tree_widget.root
+            self._row_labels["root"] = root_label
             
             self._add_children_to_tree(tree_widget.root, "root")
-            tree_widget.root.expand_all()
+            if not tree_widget.root.is_expanded:
+                tree_widget.root.expand()
             
             # Select current node
             self._select_tree_node(self.current_tree.current)
-        finally:
-            self._updating_tree = was_updating
     
-    def _format_node_label(self, node: Node) -> str:
-        """Format a node label for the tree."""
-        status_icon = node.status.icon
-        is_current = self.current_tree and node.id == self.current_tree.current
+    def _sync_node_rows(self) -> None:
+        """Bring the rows of the current tree up to date in place.
         
-        if node.id == "root":
-            label = f"root: {node.title}"
-        else:
-            label = f"[{node.id}] {status_icon} {node.title}"
+        Rows whose text changed are relabelled. A node whose children no longer
+        match its child rows gets those rows rebuilt, keeping collapsed ones
+        collapsed; everything else is left alone.
+        """
+        nodes = self.current_tree.nodes
+        index = self._tree_node_index
+        labels = self._row_labels
+        format_label = self._format_node_label
+        current_id = self.current_tree.current
+        stack = ["root"]
+        while stack:
+            node_id = stack.pop()
+            row = index[node_id]
+            label = format_label(nodes[node_id], current_id)
+            if labels.get(node_id) != label:
+                row.set_label(label)
+                labels[node_id] = label
+            
+            children = nodes[node_id].children
+            rows = row.children
+            if len(rows) == len(children) and all(
+                child_row.data == child_id for child_row, child_id in zip(rows, children)
+            ):
+                stack.extend(children)
+                continue
+            
+            if not rows and not row.is_expanded:
+                # Selecting a leaf toggles it; don't let that hide its first children
+                row.expand()
+            collapsed = self._forget_rows(rows)
+            row.remove_children()
+            self._add_children_to_tree(row, node_id, collapsed)
+    
+    def _forget_rows(self, rows: list[TreeNode]) -> set[str]:
+        """Drop rows and their descendants from the index; return the collapsed ones."""
+        index = self._tree_node_index
+        collapsed: set[str] = set()
+        stack = list(rows)
+        while stack:
+            row = stack.pop()
+            if row.children:
+                if not row.is_expanded:
+                    collapsed.add(row.data)
+                stack.extend(row.children)
+            # A node moved elsewhere may already have its new row indexed
+            if index.get(row.data) is row:
+                del index[row.data]
+                del self._row_labels[row.data]
+        return collapsed
+    
+    def refresh_node_labels(self, *node_ids: str, select: bool = True) -> None:
+        """Relabel the given nodes in place and (optionally) select the current node.
+        
+        For changes that leave the tree's shape alone (status, current node);
+        falls back to a full refresh_node_tree if a node has no row.
+        """
+        index = self._tree_node_index
+        if not self.current_tree or not all(
+            nid in index and nid in self.current_tree.nodes for nid in node_ids
+        ):
+            self.refresh_node_tree()
+            return
+        
+        nodes = self.current_tree.nodes
+        labels = self._row_labels
+        for nid in node_ids:
+            label = self._format_node_label(nodes[nid])
+            if labels[nid] != label:
+                index[nid].set_label(label)
+                labels[nid] = label
+        if select:
+            with self.prevent(Tree.NodeHighlighted):
+                self._select_tree_node(self.current_tree.current)
+    
+    def _format_node_label(self, node: Node, current_id: str | None = None) -> str:
+        """Format a node label for the tree.
         
-        # Add current marker with emphasis
-        if is_current:
-            return f"● {label}"
-        return f"  {label}"
+        Callers labelling many rows pass the current node's ID once rather
+        than have it looked up for every row.
+        """
+        if current_id is None and self.current_tree:
+            current_id = self.current_tree.current
+        # Current marker with emphasis
+        marker = "●" if node.id == current_id else " "
+        if node.id == "root":
+            return f"{marker} root: {node.title}"
+        return f"{marker} [{node.id}] {node.status.icon} {node.title}"
     
-    def _add_children_to_tree(self, parent: TreeNode, node_id: str) -> None:
-        """Recursively add children to tree widget."""
+    def _add_children_to_tree(
+        self, parent: TreeNode, node_id: str, collapsed: set[str] = frozenset()
+    ) -> None:
+        """Add the subtree below node_id to the tree widget under parent.
+        
+        Rows start expanded unless their node ID is in collapsed.
+        """
         if not self.current_tree:
             return
         
-        node = self.current_tree.nodes[node_id]
-        for child_id in node.children:
-            child = self.current_tree.nodes[child_id]
-            child_tree_node = parent.add(self._format_node_label(child), data=child_id)
-            self._add_children_to_tree(child_tree_node, child_id)
+        nodes = self.current_tree.nodes
+        index = self._tree_node_index
+        labels = self._row_labels
+        format_label = self._format_node_label
+        current_id = self.current_tree.current
+        # Each node's children are added together and in order, so the order
+        # the stack visits parents in doesn't matter
+        stack = [(parent, node_id)]
+        while stack:
+            parent, node_id = stack.pop()
+            for child_id in nodes[node_id].children:
+                label = format_label(nodes[child_id], current_id)
+                child_tree_node = parent.add(label, data=child_id, expand=child_id not in collapsed)
+                index[child_id] = child_tree_node
+                labels[child_id] = label
+                stack.append((child_tree_node, child_id))
     
     def _select_tree_node(self, node_id: str) -> None:
         """Select a node in the tree widget."""
-        tree_widget = self.query_one("#node-tree", Tree)
-        
-        def find_node(tree_node: TreeNode) -> TreeNode | None:
-            if tree_node.data == node_id:
-                return tree_node
-            for child in tree_node.children:
-                result = find_node(child)
-                if result:
-                    return result
-            return None
-        
-        target = find_node(tree_widget.root)
+        target = self._tree_node_index.get(node_id)
         if target:
-            tree_widget.select_node(target)
-            target.expand()
+            # The row must be visible to take the cursor
+            ancestor = target.parent
+            while ancestor is not None:
+                if not ancestor.is_expanded:
+                    ancestor.expand()
+                ancestor = ancestor.parent
+            if not target.is_expanded:
+                target.expand()
+            # Rows get their line numbers when the widget lays itself out,
+            # so the cursor is placed after the next refresh
+            if not self._cursor_pending:
+                self._cursor_pending = True
+                self.call_after_refresh(self._place_cursor)
+    
+    def _place_cursor(self) -> None:
+        """Put the tree cursor on the current node's row."""
+        self._cursor_pending = False
+        tree = self.current_tree
+        target = self._tree_node_index.get(tree.current) if tree else None
+        if target is None or target.line < 0:
+            return
+        tree_widget = self._tree_widget
+        # Setting cursor_line rather than select_node: a NodeSelected would
+        # toggle (collapse) the row. The node is already current, so the
+        # highlight must not navigate either.
+        with self.prevent(Tree.NodeHighlighted):
+            tree_widget.cursor_line = target.line
+        tree_widget.scroll_to_node(target, animate=False)
     
     def refresh_content(self) -> None:
-        """Refresh the content panel."""
-        title_widget = self.query_one("#node-title", Static)
-        meta_widget = self.query_one("#node-meta", Static)
-        body_widget = self.query_one("#node-body", Markdown)
-        links_widget = self.query_one("#links-section", Static)
+        """Refresh the content panel, unless it already shows this node as it is now."""
+        tree = self.current_tree
+        # Every tree mutation bumps tree._version, so an equal key means nothing
+        # changed. The tree is compared by identity: == would compare all its nodes.
+        key = (tree, tree.current, tree._version) if tree else (None,)
+        shown = self._content_key
+        if shown is not None and shown[0] is tree and shown[1:] == key[1:]:
+            return
+        self._content_key = key
+        
+        title_widget = self._title_widget
+        meta_widget = self._meta_widget
+        body_widget = self._body_widget
+        links_widget = self._links_widget
         
         if not self.current_tree:
             title_widget.update("未加载树")
             meta_widget.update("")
-            body_widget.update("使用 `n` 新建树，或从左侧选择")
+            self._update_body(body_widget, "使用 `n` 新建树，或从左侧选择")
             links_widget.update("")
             return
         
@@ -754,65 +1087,124 @@ class DelvApp(App):
         meta_widget.update(f"[{node.id}] · {node.status.value}")
         
         # Body
-        if node.body:
-            body_widget.update(node.body)
-        else:
-            body_widget.update("*空*")
+        self._update_body(body_widget, node.body or "*空*")
         
         # Links
+        nodes = self.current_tree.nodes
         links_parts = []
         if node.links:
-            link_strs = []
-            for lid in node.links:
-                link_node = self.current_tree.nodes.get(lid)
-                if link_node:
-                    link_strs.append(f"[{lid}] {link_node.title}")
-            links_parts.append("→ " + ", ".join(link_strs))
+            links_parts.append("→ " + ", ".join(
+                f"[{lid}] {nodes[lid].title}" for lid in node.links if lid in nodes
+            ))
         
         backlinks = self.current_tree.get_backlinks(node.id)
         if backlinks:
-            bl_strs = []
-            for blid in backlinks:
-                bl_node = self.current_tree.nodes.get(blid)
-                if bl_node:
-                    bl_strs.append(f"[{blid}] {bl_node.title}")
-            links_parts.append("← " + ", ".join(bl_strs))
+            links_parts.append("← " + ", ".join(
+                f"[{blid}] {nodes[blid].title}" for blid in backlinks if blid in nodes
+            ))
         
-        links_widget.update("\n".join(links_parts) if links_parts else "")
+        links_widget.update("\n".join(links_parts))
+    
+    def _schedule_content_refresh(self) -> None:
+        """Refresh the content panel once the queued messages are handled.
+        
+        Holding j/k queues a highlight per row; only the row the cursor
+        ends up on gets rendered.
+        """
+        if not self._content_pending:
+            self._content_pending = True
+            self.call_after_refresh(self._run_content_refresh)
+    
+    def _run_content_refresh(self) -> None:
+        self._content_pending = False
+        self.refresh_content()
+    
+    def _update_body(self, body_widget: Markdown, source: str) -> None:
+        """Show source in the body panel, skipping the Markdown re-parse if it is already shown."""
+        if source != self._body_source:
+            self._body_source = source
+            body_widget.update(source)
     
     def update_focus(self) -> None:
         """Focus the appropriate widget based on focus_panel."""
         # CSS :focus-within handles visual styling automatically
         if self.focus_panel == 0:
-            self.query_one("#trees-list", OptionList).focus()
+            self._trees_view.focus()
         elif self.focus_panel == 1:
-            self.query_one("#node-tree", Tree).focus()
+            self._tree_widget.focus()
         elif self.focus_panel == 2:
-            self.query_one("#content-scroll", VerticalScroll).focus()
+            self._content_scroll.focus()
+    
+    # Edits within this many seconds of each other are written in one save
+    SAVE_DELAY = 0.5
     
     def save_tree(self) -> None:
-        """Save the current tree."""
-        if self.current_tree:
-            save_tree(self.current_tree)
+        """Schedule a save of the current tree, coalescing bursts of edits."""
+        if not self.current_tree:
+            return
+        if self._save_pending is not None and self._save_pending is not self.current_tree:
+            self.flush_save()
+        self._save_pending = self.current_tree
+        if self._save_timer is None:
+            self._save_timer = self.set_timer(self.SAVE_DELAY, self.flush_save)
+    
+    class SaveFailed(Message):
+        """A save in the writer thread raised."""
+        
+        def __init__(self, error: str) -> None:
+            super().__init__()
+            self.error = error
+    
+    def flush_save(self, wait: bool = False, sync: bool = False) -> None:
+        """Write any scheduled save now, in the writer thread.
+        
+        With wait, block until it (and any earlier save) is written; with
+        sync, it is also flushed to the disk.
+        """
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+        tree, self._save_pending = self._save_pending, None
+        if tree is not None:
+            # Serialize here so the writer never sees the tree mid-edit
+            future = self._save_executor.submit(
+                write_tree_data, tree.name, encode_tree(tree), sync=sync
+            )
+        elif wait:
+            future = self._save_executor.submit(lambda: None)  # Queued after earlier saves
+        else:
+            return
+        
+        if wait:
+            future.result()
+        else:
+            future.add_done_callback(self._on_save_done)
+    
+    def _on_save_done(self, future: Future) -> None:
+        # Runs in the writer thread; post_message is safe from there
+        if error := future.exception():
+            self.post_message(self.SaveFailed(str(error)))
+    
+    def on_delv_app_save_failed(self, message: SaveFailed) -> None:
+        self.notify(f"保存失败: {message.error}", severity="error")
+    
+    async def _in_writer(self, func: Callable[..., None], *args: object) -> None:
+        """Run a storage call in the writer thread, after any saves already queued."""
+        await asyncio.wrap_future(self._save_executor.submit(func, *args))
     
     def navigate_to(self, node_id: str) -> None:
         """Navigate to a node."""
-        if self._updating_tree:
-            return
         if self.current_tree and node_id in self.current_tree.nodes:
             if self.current_tree.current == node_id:
                 # Already at this node, just update content
                 self.refresh_content()
                 return
-            self._updating_tree = True
-            try:
-                self.current_tree.go_to(node_id)
-                self.save_tree()
-                self.refresh_node_tree()
-                self.refresh_content()
-                self.link_index = 0
-            finally:
-                self._updating_tree = False
+            previous = self.current_tree.current
+            self.current_tree.go_to(node_id)
+            self.save_tree()
+            self.refresh_node_labels(previous, node_id)
+            self.refresh_content()
+            self.link_index = 0
     
     # === Actions ===
     
@@ -828,27 +1220,27 @@ class DelvApp(App):
     
     def action_move_down(self) -> None:
         if self.focus_panel == 0:
-            self.query_one("#trees-list", OptionList).action_cursor_down()
+            self._trees_view.action_cursor_down()
         elif self.focus_panel == 1:
-            self.query_one("#node-tree", Tree).action_cursor_down()
+            self._tree_widget.action_cursor_down()
     
     def action_move_up(self) -> None:
         if self.focus_panel == 0:
-            self.query_one("#trees-list", OptionList).action_cursor_up()
+            self._trees_view.action_cursor_up()
         elif self.focus_panel == 1:
-            self.query_one("#node-tree", Tree).action_cursor_up()
+            self._tree_widget.action_cursor_up()
     
     def action_select(self) -> None:
         if self.focus_panel == 0:
             # Select tree - handled by OptionList.OptionSelected event
-            trees_view = self.query_one("#trees-list", OptionList)
+            trees_view = self._trees_view
             if trees_view.highlighted is not None:
                 option = trees_view.get_option_at_index(trees_view.highlighted)
                 if option.id:
                     self._select_tree(option.id)
         elif self.focus_panel == 1:
             # Enter node
-            tree_widget = self.query_one("#node-tree", Tree)
+            tree_widget = self._tree_widget
             if tree_widget.cursor_node and tree_widget.cursor_node.data:
                 self.navigate_to(tree_widget.cursor_node.data)
     
@@ -861,32 +1253,50 @@ class DelvApp(App):
         self.update_focus()
     
     def action_go_parent(self) -> None:
-        if self.current_tree and self.current_tree.go_up():
+        if not self.current_tree:
+            return
+        
+        previous = self.current_tree.current
+        if self.current_tree.go_up():
             self.save_tree()
-            self.refresh_node_tree()
+            self.refresh_node_labels(previous, self.current_tree.current)
             self.refresh_content()
     
     def action_go_back(self) -> None:
-        if self.current_tree and self.current_tree.go_back():
+        if not self.current_tree:
+            return
+        
+        previous = self.current_tree.current
+        if self.current_tree.go_back():
             self.save_tree()
-            self.refresh_node_tree()
+            self.refresh_node_labels(previous, self.current_tree.current)
             self.refresh_content()
     
     def action_go_root(self) -> None:
         if self.current_tree:
+            previous = self.current_tree.current
             self.current_tree.go_root()
             self.save_tree()
-            self.refresh_node_tree()
+            self.refresh_node_labels(previous, "root")
             self.refresh_content()
     
+    def _get_id_suggester(self) -> NodeIdSuggester:
+        """Return the node ID suggester for the current tree, reused across prompts."""
+        suggester = self._id_suggester
+        if suggester is None or suggester._tree is not self.current_tree:
+            suggester = self._id_suggester = NodeIdSuggester(self.current_tree)
+        else:
+            suggester.refresh()
+        return suggester
+    
     @work
     async def action_goto_node(self) -> None:
         if not self.current_tree:
             return
         
-        # Use NodeIdSuggester for autocomplete
-        suggester = NodeIdSuggester(self.current_tree)
-        result = await self.push_screen_wait(InputScreen("跳转到节点 ID:", suggester=suggester))
+        result = await self.push_screen_wait(
+            InputScreen("跳转到节点 ID:", suggester=self._get_id_suggester())
+        )
         if result and result in self.current_tree.nodes:
             self.navigate_to(result)
     
@@ -933,6 +1343,8 @@ class DelvApp(App):
             self.refresh_content()
     
     def action_edit_external(self) -> None:
+        from .editor import edit_node_interactive
+        
         if not self.current_tree:
             return
         
@@ -940,11 +1352,13 @@ class DelvApp(App):
         
         with self.suspend():
             try:
-                edit_node_interactive(self.current_tree, node_id)
+                changed = edit_node_interactive(self.current_tree, node_id)
             except ValueError as e:
                 self.notify(str(e), severity="error")
                 return
         
+        if not changed:
+            return
         self.save_tree()
         self.refresh_node_tree()
         self.refresh_content()
@@ -977,30 +1391,33 @@ class DelvApp(App):
         if not self.current_tree:
             return
         
-        self.current_tree.set_status(self.current_tree.current, NodeStatus.DONE, auto_up=True)
-        self.save_tree()
-        self.refresh_node_tree()
-        self.refresh_content()
+        node_id = self.current_tree.current
+        if self.current_tree.set_status(node_id, NodeStatus.DONE, auto_up=True):
+            self.save_tree()
+            self.refresh_node_labels(node_id, self.current_tree.current)
+            self.refresh_content()
         self.notify("✓ 已完成", timeout=1.5)
     
     def action_mark_dropped(self) -> None:
         if not self.current_tree:
             return
         
-        self.current_tree.set_status(self.current_tree.current, NodeStatus.DROPPED, auto_up=True)
-        self.save_tree()
-        self.refresh_node_tree()
-        self.refresh_content()
+        node_id = self.current_tree.current
+        if self.current_tree.set_status(node_id, NodeStatus.DROPPED, auto_up=True):
+            self.save_tree()
+            self.refresh_node_labels(node_id, self.current_tree.current)
+            self.refresh_content()
         self.notify("✗ 已放弃", timeout=1.5)
     
     def action_mark_todo(self) -> None:
         if not self.current_tree:
             return
         
-        self.current_tree.set_status(self.current_tree.current, NodeStatus.TODO, auto_up=False)
-        self.save_tree()
-        self.refresh_node_tree()
-        self.refresh_content()
+        node_id = self.current_tree.current
+        if self.current_tree.set_status(node_id, NodeStatus.TODO, auto_up=False):
+            self.save_tree()
+            self.refresh_node_labels(node_id, self.current_tree.current)
+            self.refresh_content()
         self.notify("? 待办", timeout=1.5)
     
     @work
@@ -1043,7 +1460,12 @@ class DelvApp(App):
             return
         
         result = await self.push_screen_wait(
-            SelectNodeScreen(self.current_tree, f"移动 [{self.current_tree.current}] 到:", self.current_tree.current)
+            SelectNodeScreen(
+                self.current_tree,
+                f"移动 [{self.current_tree.current}] 到:",
+                # The node can't go under itself or its descendants
+                (nid for nid, _ in self.current_tree.iter_tree(self.current_tree.current)),
+            )
         )
         if result:
             try:
@@ -1058,34 +1480,82 @@ class DelvApp(App):
             return
         
         node = self.current_tree.get_current_node()
-        try:
-            pyperclip.copy(node.body)
-            self.notify("已复制内容", timeout=1.5)
-        except Exception:
-            self.notify("剪贴板不可用", severity="warning")
+        self._copy_text(node.body, "已复制内容")
     
     def action_paste_body(self) -> None:
         if not self.current_tree:
             return
         
-        try:
-            text = pyperclip.paste()
-            self.current_tree.append_body(self.current_tree.current, text)
-            self.save_tree()
-            self.refresh_content()
-            self.notify("已粘贴", timeout=1.5)
-        except Exception:
-            self.notify("剪贴板不可用", severity="warning")
+        self._paste_worker(self.current_tree, self.current_tree.current)
     
     def action_yank_id(self) -> None:
         if not self.current_tree:
             return
         
+        node_id = self.current_tree.current
+        self._copy_text(node_id, f"已复制 [{node_id}]")
+    
+    # === Clipboard ===
+    # Precedence: OSC 52 on terminals known to accept it, otherwise pyperclip,
+    # then OSC 52 as a last resort when pyperclip has no backend.
+    # pyperclip shells out to xclip/xsel/wl-copy on Linux, so it runs off the UI thread.
+    
+    def _copy_text(self, text: str, message: str) -> None:
+        if _terminal_clipboard():
+            self._copy_via_terminal(text)
+        else:
+            self._copy_worker(text, message)
+    
+    def _copy_via_terminal(self, text: str) -> None:
+        # A single OSC 52 escape written by the driver. Terminals that don't
+        # support it drop it silently, so the notice can't claim success.
+        self.copy_to_clipboard(text)
+        self.notify("已发送到终端剪贴板", timeout=1.5)
+    
+    @work(thread=True, exclusive=True, group="clipboard")
+    def _copy_worker(self, text: str, message: str) -> None:
+        import pyperclip
+        
         try:
-            pyperclip.copy(self.current_tree.current)
-            self.notify(f"已复制 [{self.current_tree.current}]", timeout=1.5)
+            pyperclip.copy(text)
         except Exception:
-            self.notify("剪贴板不可用", severity="warning")
+            # No usable backend (e.g. no xclip, or an SSH session without a
+            # forwarded display); the terminal may still take it
+            self.call_from_thread(self._copy_via_terminal, text)
+        else:
+            self.call_from_thread(self.notify, message, timeout=1.5)
+    
+    @work(thread=True, exclusive=True, group="clipboard")
+    def _paste_worker(self, tree: ExplorationTree, node_id: str) -> None:
+        import pyperclip
+        
+        try:
+            text = pyperclip.paste()
+        except Exception:
+            self.call_from_thread(self.notify, "剪贴板不可用", severity="warning")
+        else:
+            self.call_from_thread(self._apply_paste, tree, node_id, text)
+    
+    # Pastes longer than this (in characters) ask for confirmation first
+    PASTE_CONFIRM_SIZE = 1_000_000
+    
+    def _apply_paste(
+        self, tree: ExplorationTree, node_id: str, text: str, confirmed: bool = False
+    ) -> None:
+        if tree is not self.current_tree or node_id not in tree.nodes:
+            return
+        if len(text) > self.PASTE_CONFIRM_SIZE and not confirmed:
+            # Most likely the wrong thing on the clipboard; it would go into every save
+            def on_confirm(result: bool | None) -> None:
+                if result:
+                    self._apply_paste(tree, node_id, text, confirmed=True)
+            
+            self.push_screen(ConfirmScreen(f"粘贴 {len(text):,} 个字符?"), on_confirm)
+            return
+        tree.append_body(node_id, text)
+        self.save_tree()
+        self.refresh_content()
+        self.notify("已粘贴", timeout=1.5)
     
     @work
     async def action_new_tree(self) -> None:
@@ -1096,7 +1566,7 @@ class DelvApp(App):
                 return
             
             tree = ExplorationTree.create(result, "根节点")
-            save_tree(tree, backup=False)
+            await self._in_writer(save_tree, tree, False)
             set_current_tree_name(result)
             self.load_current_tree()
             self.refresh_trees_list()
@@ -1113,9 +1583,14 @@ class DelvApp(App):
                 self.notify(f"树 '{result}' 已存在", severity="error")
                 return
             
-            old_name = self.current_tree.name
+            tree = self.current_tree
+            old_name = tree.name
             try:
-                rename_tree(old_name, result)
+                self.flush_save()  # rename_tree works from the file on disk
+                await self._in_writer(rename_tree, old_name, result)
+                if tree.name == old_name:
+                    # Edits made while the file was renamed get saved under the new name
+                    tree.name = result
                 set_current_tree_name(result)
                 self.load_current_tree()
                 self.refresh_trees_list()
@@ -1133,9 +1608,12 @@ class DelvApp(App):
         )
         if confirmed:
             name = self.current_tree.name
-            delete_tree(name)
-            set_current_tree_name(None)
+            if self._save_pending is self.current_tree:
+                self._save_pending = None  # Nothing left to save it to
+            # Detach first so nothing schedules a save of it while the file is removed
             self.current_tree = None
+            set_current_tree_name(None)
+            await self._in_writer(delete_tree, name)
             self.refresh_trees_list()
             self.refresh_node_tree()
             self.refresh_content()
@@ -1157,7 +1635,7 @@ class DelvApp(App):
         self.push_screen(StatisticsScreen(self.current_tree))
     
     def action_show_help(self) -> None:
-        self.push_screen(HelpScreen())
+        self.push_screen("help")
     
     @work
     async def action_select_theme(self) -> None:
@@ -1173,24 +1651,22 @@ class DelvApp(App):
     
     def action_force_save(self) -> None:
         self.save_tree()
+        self.flush_save(wait=True, sync=True)
         self.notify("已保存", timeout=1.5)
     
     @on(Tree.NodeHighlighted)
     def on_tree_node_highlighted(self, event: Tree.NodeHighlighted) -> None:
         """Handle tree node highlight (cursor movement)."""
-        if self._updating_tree:
-            return
         if event.node.data and self.current_tree:
             node_id = event.node.data
             if self.current_tree.current != node_id:
-                self._updating_tree = True
-                try:
-                    self.current_tree.go_to(node_id)
-                    self.save_tree()
-                    self.refresh_content()
-                    self.link_index = 0
-                finally:
-                    self._updating_tree = False
+                previous = self.current_tree.current
+                self.current_tree.go_to(node_id)
+                self.save_tree()
+                # The cursor is already on the node; just move the marker
+                self.refresh_node_labels(previous, node_id, select=False)
+                self._schedule_content_refresh()
+                self.link_index = 0
     
     @on(OptionList.OptionSelected, "#trees-list")
     def on_tree_list_selected(self, event: OptionList.OptionSelected) -> None: